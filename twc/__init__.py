@@ -2,4 +2,13 @@
 
 from .__version__ import __version__
 
-from .api import TimewebCloud
+
+def __getattr__(name: str):
+    # Import API client on first access. This keeps CLI startup fast
+    # because 'requests' is not imported for 'twc --help' and so on.
+    if name == "TimewebCloud":
+        # pylint: disable=import-outside-toplevel
+        from .api import TimewebCloud
+
+        return TimewebCloud
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,62 @@
 """Timeweb Cloud API client implementation."""
 
-from .client import TimewebCloud
-from .exceptions import *
+import importlib
+from typing import TYPE_CHECKING
+
 from .types import *
+
+if TYPE_CHECKING:
+    from .client import TimewebCloud
+    from .exceptions import *
+
+__all__ = [
+    "TimewebCloud",
+    # Exceptions
+    "ErrResponse",
+    "TimewebCloudException",
+    "UnauthorizedError",
+    "MalformedResponseError",
+    "UnexpectedResponseError",
+    "BadRequestError",
+    "ForbiddenError",
+    "NotFoundError",
+    "ConflictError",
+    "LockedError",
+    "TooManyRequestsError",
+    "InternalServerError",
+    "NetworkError",
+    # Types
+    "ServiceRegion",
+    "ServiceAvailabilityZone",
+    "REGION_ZONES",
+    "ZONE_REGION",
+    "ServerAction",
+    "ServerLogOrder",
+    "ServerBootMode",
+    "ServerNATMode",
+    "IPVersion",
+    "ServerConfiguration",
+    "ServerOSType",
+    "BackupAction",
+    "BackupInterval",
+    "ResourceType",
+    "DBMS",
+    "MySQLAuthPlugin",
+    "BucketType",
+    "LoadBalancerProto",
+    "LoadBalancerAlgo",
+    "DNSRecordType",
+    "FirewallProto",
+    "FirewallDirection",
+    "FirewallPolicy",
+]
+
+
+def __getattr__(name: str):
+    # Client and exceptions import 'requests'. They are imported on first
+    # access, so CLI modules which need only types load fast.
+    if name == "TimewebCloud":
+        return importlib.import_module(".client", __name__).TimewebCloud
+    if name in __all__:
+        return getattr(importlib.import_module(".exceptions", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
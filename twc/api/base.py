@@ -1,15 +1,162 @@
 """Base module for Timeweb Cloud API client."""
 
+import json as _json
 import logging
+import random
+import sys
 import textwrap
-from typing import Optional, Callable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
+from ipaddress import IPv4Address, IPv6Address, IPv4Network, IPv6Network
+from typing import (
+    Optional,
+    Callable,
+    Dict,
+    Type,
+    List,
+    Any,
+    Tuple,
+    Iterator,
+    Iterable,
+)
+from uuid import UUID
+
+# Optional fast JSON library.
+try:
+    # pylint: disable=import-error
+    from orjson import loads as json_loads, dumps as orjson_dumps
+except ImportError:
+    orjson_dumps = None
+    try:
+        from ujson import loads as json_loads  # pylint: disable=import-error
+    except ImportError:
+        json_loads = _json.loads
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING as DEFAULT_ACCEPT_ENCODING
 
 from twc.__version__ import __version__, __pyversion__
 from . import exceptions as exc
 
 
+# Exceptions raised on HTTP errors which have API error response body.
+STATUS_TO_EXCEPTION: Dict[int, Type[exc.TimewebCloudException]] = {
+    400: exc.BadRequestError,
+    403: exc.ForbiddenError,
+    404: exc.NotFoundError,
+    409: exc.ConflictError,
+    423: exc.LockedError,
+    429: exc.TooManyRequestsError,
+    500: exc.InternalServerError,
+}
+
+
+# Non-JSON types which API accepts as strings in request payload.
+JSON_STR_TYPES = (UUID, IPv4Address, IPv6Address, IPv4Network, IPv6Network)
+
+
+def json_default(obj):
+    """Serialize value which JSON cannot represent natively. Only UUIDs and
+    IP addresses/networks are sent as strings, anything else is caller bug.
+    """
+    if isinstance(obj, JSON_STR_TYPES):
+        return str(obj)
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+HTTP_LOG_TEMPLATE = textwrap.dedent(
+    """
+    ---------------- Request ----------------
+    {req.method} {req.url}
+    {req_headers}
+
+    {req_body}
+    ---------------- Response ---------------
+    {res.status_code} {res.reason} {res.url}
+    {res_headers}
+
+    {res_body}"""
+)
+
+
+class HTTPLogMessage:
+    """Request and response dump for log. Message is formatted only when
+    log record is actually emitted.
+    """
+
+    __slots__ = ("client", "response")
+
+    def __init__(
+        self, client: "TimewebCloudBase", response: requests.Response
+    ):
+        self.client = client
+        self.response = response
+
+    def __str__(self) -> str:
+        response = self.response
+        # pylint: disable=protected-access
+        if not response._content_consumed:
+            # Streamed response, body is left to caller.
+            res_body = "<NOT_LOGGED>"
+        else:
+            res_body = response.text or "<NO_BODY>"
+        req_body = response.request.body or "<NO_BODY>"
+        if isinstance(req_body, (bytes, bytearray)):
+            req_body = req_body.decode(errors="replace")
+        elif not isinstance(req_body, str):
+            # Streamed body e.g. file upload. It is already sent.
+            req_body = "<NOT_LOGGED>"
+
+        return HTTP_LOG_TEMPLATE.format(
+            req=response.request,
+            req_headers=self.client._format_headers(
+                self.client._secure_log(response.request.headers)
+            ),
+            req_body=req_body,
+            res=response,
+            res_headers=self.client._format_headers(response.headers),
+            res_body=res_body,
+        )
+
+
+class RetryPolicy(Retry):
+    """Retry policy for API requests. Idempotent requests are retried on
+    gateway errors. Any request is retried on 429 Too Many Requests since
+    API did not process it. Retry-After header is respected up to
+    MAX_RETRY_AFTER seconds, otherwise exponential backoff with random
+    jitter is used.
+    """
+
+    BACKOFF_JITTER = 0.5
+    MAX_RETRY_AFTER = 60
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is not None:
+            retry_after = min(retry_after, self.MAX_RETRY_AFTER)
+        return retry_after
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff:
+            backoff += random.uniform(0, self.BACKOFF_JITTER)
+        return backoff
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class TimewebCloudBase:
     """Base class for Timeweb Cloud API client."""
 
@@ -19,6 +166,25 @@ class TimewebCloudBase:
     API_BASE_URL = "https://api.timeweb.cloud"
     TIMEOUT = 100
     USER_AGENT = f"TWC-CLI/{__version__} Python {__pyversion__}"
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 32
+    MAX_CONCURRENT_REQUESTS = 16
+    CACHE_MAXSIZE = 128
+    URL_CACHE_MAXSIZE = 256
+    # Max seconds to wait for API rate limit reset before request
+    RATELIMIT_MAX_WAIT = RetryPolicy.MAX_RETRY_AFTER
+    BASE_HEADERS = requests.utils.default_headers()
+    # Advertise every content coding urllib3 can decode in this
+    # environment, e.g. "br" when brotli package is installed.
+    BASE_HEADERS["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+    JSON_HEADERS = {"Content-Type": "application/json"}
+
+    # API endpoints URL templates: name -> path with positional fields.
+    # ENDPOINTS paths are relative to api_path, ENDPOINTS_V1 and ENDPOINTS_V2
+    # are pinned to the API version which provides them.
+    ENDPOINTS: Dict[str, str] = {}
+    ENDPOINTS_V1: Dict[str, str] = {}
+    ENDPOINTS_V2: Dict[str, str] = {}
 
     def __init__(
         self,
@@ -30,69 +196,310 @@ class TimewebCloudBase:
         timeout: Optional[int] = TIMEOUT,
         hide_token: Optional[bool] = True,
         request_decorator: Optional[Callable] = None,
+        auto_retry: Optional[bool] = True,
     ):
         self.api_token = api_token
         self.api_base_url = api_base_url
         self.api_path = api_path
-        self.api_url = self.api_base_url + self.api_path
+        self.api_url = sys.intern(self.api_base_url + self.api_path)
         self.api_url_v1 = self.api_base_url + "/api/v1"
         self.api_url_v2 = self.api_base_url + "/api/v2"
+
+        # Bound str.format() of endpoint URL templates, call it with path
+        # fields e.g. self._ep["disk"](server_id, disk_id) to get full URL.
+        # Formatted URLs are memoized, scripts often hit the same IDs.
+        url_cache = lru_cache(maxsize=self.URL_CACHE_MAXSIZE)
+        self._ep = {
+            **{
+                name: url_cache((self.api_url + path).format)
+                for name, path in self.ENDPOINTS.items()
+            },
+            **{
+                name: url_cache((self.api_url_v1 + path).format)
+                for name, path in self.ENDPOINTS_V1.items()
+            },
+            **{
+                name: url_cache((self.api_url_v2 + path).format)
+                for name, path in self.ENDPOINTS_V2.items()
+            },
+        }
+
         self.timeout = timeout
-        self.headers = requests.utils.default_headers()
-        self.headers["User-Agent"] = user_agent
-        self.headers["Authorization"] = f"Bearer {self.api_token}"
+        self.headers = CaseInsensitiveDict(
+            {
+                **self.BASE_HEADERS,
+                "User-Agent": user_agent,
+                "Authorization": f"Bearer {self.api_token}",
+                **(headers or {}),
+            }
+        )
         self.log = logging.getLogger("api_client")
         self.hide_token = hide_token
+        self._redacted_headers = self._redact_headers(self.headers)
+
+        # Share one session between all requests to reuse TCP and TLS
+        # connections. With `auto_retry` requests are retried on rate limit
+        # and gateway errors, else TooManyRequestsError is raised at once.
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=(
+                RetryPolicy(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 502, 503, 504),
+                    raise_on_status=False,
+                )
+                if auto_retry
+                else 0
+            ),
+        )
+        self._session = requests.Session()
+        self._session.headers = self.headers
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
-        if headers:
-            self.headers.update(headers)
+        # Monotonic time until which API rate limit is exhausted, it is
+        # updated from X-RateLimit-* response headers, see _request()
+        self._ratelimit_until = 0.0
+
+        # In-memory cache for read-mostly catalog data, see _cached_get()
+        self._cache: Dict[tuple, Tuple[requests.Response, float]] = {}
+        self._cache_lock = threading.Lock()
+        self._refreshing = set()
+        # Incremented on cache drop, so fetches started before it are not
+        # stored
+        self._cache_generation = 0
+        # Last responses with validators for conditional requests, see
+        # _revalidated_get()
+        self._validated: Dict[tuple, requests.Response] = {}
 
         # Decorate _request()
         if request_decorator is not None:
             self._request = request_decorator(self._request)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Close underlying HTTP session and its connections."""
+        self._session.close()
+
+    def _gather(
+        self, *calls: Callable[[], Any], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Run independent API calls concurrently and return their results
+        in the same order. Calls share the session connection pool, at most
+        MAX_CONCURRENT_REQUESTS of them are in flight at once. With
+        `return_exceptions` failed call doesn't abort others, its exception
+        is returned in place of result.
+        """
+        workers = min(len(calls), self.MAX_CONCURRENT_REQUESTS) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as err:  # pylint: disable=broad-except
+                    if not return_exceptions:
+                        raise
+                    results.append(err)
+            return results
+
+    def batch(
+        self,
+        calls: Iterable[Callable[[], Any]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run independent API calls concurrently, return results in
+        submission order. Wrap calls with `functools.partial`::
+
+            client.batch(partial(client.get_k8s_nodes, i) for i in ids)
+        """
+        return self._gather(*calls, return_exceptions=return_exceptions)
+
+    def _iter_pages(
+        self,
+        fetch: Callable[..., requests.Response],
+        key: str,
+        page_size: int = 100,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """Yield all items of paginated list. `fetch` is client method with
+        `limit` and `offset` arguments, `key` is name of items list in
+        response. First page tells total items count, then the rest pages
+        are requested concurrently. Items are yielded in API order.
+        """
+        first = self._parse_json(fetch(limit=page_size, offset=0, **kwargs))
+        yield from first[key]
+        total = first.get("meta", {}).get("total", 0)
+        pages = self._gather(
+            *(
+                partial(fetch, limit=page_size, offset=offset, **kwargs)
+                for offset in range(page_size, total, page_size)
+            )
+        )
+        for page in pages:
+            yield from self._parse_json(page)[key]
+
+    def _cached_get(
+        self, url: str, ttl: float, params: Optional[dict] = None
+    ) -> requests.Response:
+        """GET `url` through in-memory cache. Use it for catalog data like
+        presets and OS images which changes rarely. Cached response expires
+        after `ttl` seconds, then it is still returned while fresh one is
+        fetched in background thread (stale-while-revalidate) using ETag
+        if API provides it. Any write request drops the cache.
+        """
+        key = (url, frozenset(params.items()) if params else None)
+        entry = self._cache.get(key)
+        if entry is None:
+            return self._fetch_cached(key, url, ttl, params)
+        response, expires_at = entry
+        if time.monotonic() >= expires_at:
+            with self._cache_lock:
+                refresh = key not in self._refreshing
+                self._refreshing.add(key)
+            if refresh:
+                threading.Thread(
+                    target=self._refresh_cached,
+                    args=(key, url, ttl, params),
+                    daemon=True,
+                ).start()
+        return response
+
+    def _fetch_cached(
+        self, key: tuple, url: str, ttl: float, params: Optional[dict]
+    ) -> requests.Response:
+        """Make GET request and store response in cache. Expired entries
+        are refetched with validators, see `_revalidated_get()`.
+        """
+        generation = self._cache_generation
+        try:
+            response = self._revalidated_get(url, params=params)
+            with self._cache_lock:
+                # Cache was dropped by write request while fetching,
+                # response may be already out of date.
+                if generation == self._cache_generation:
+                    if len(self._cache) >= self.CACHE_MAXSIZE:
+                        del self._cache[next(iter(self._cache))]
+                    self._cache[key] = (response, time.monotonic() + ttl)
+            return response
+        finally:
+            with self._cache_lock:
+                self._refreshing.discard(key)
+
+    def _refresh_cached(
+        self, key: tuple, url: str, ttl: float, params: Optional[dict]
+    ) -> None:
+        """Background refresh of expired cache entry. Errors are logged and
+        stale response is kept, next refresh is tried after a minute.
+        """
+        try:
+            self._fetch_cached(key, url, ttl, params)
+        # request_decorator may call sys.exit() on API errors
+        except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+            self.log.warning("Failed to refresh %s: %r", url, err)
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    self._cache[key] = (
+                        entry[0],
+                        time.monotonic() + min(ttl, 60),
+                    )
+
+    def _revalidated_get(
+        self, url: str, params: Optional[dict] = None
+    ) -> requests.Response:
+        """GET `url` with HTTP revalidation. Last response which have ETag
+        or Last-Modified header is kept and its validators are sent with
+        next request. If API responds 304 Not Modified the kept response is
+        returned, so unchanged body is not downloaded again.
+        """
+        key = (url, frozenset(params.items()) if params else None)
+        with self._cache_lock:
+            cached = self._validated.get(key)
+        headers = {}
+        if cached is not None:
+            etag = cached.headers.get("ETag")
+            if etag:
+                headers["If-None-Match"] = etag
+            last_modified = cached.headers.get("Last-Modified")
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        response = self._request("GET", url, headers=headers, params=params)
+        if response.status_code == 304 and cached is not None:
+            return cached
+        if "ETag" in response.headers or "Last-Modified" in response.headers:
+            with self._cache_lock:
+                if len(self._validated) >= self.CACHE_MAXSIZE:
+                    self._validated.pop(next(iter(self._validated)), None)
+                self._validated[key] = response
+        return response
+
+    def _update_ratelimit(self, response: requests.Response) -> None:
+        """Remember when requests can be sent again if API reports that
+        rate limit is exhausted. X-RateLimit-Reset may be seconds to reset
+        or Unix timestamp of reset. Unparseable or too long delay is not
+        waited for, then API responds 429 and Retry-After is honoured.
+        """
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        value = response.headers.get("X-RateLimit-Reset", "1")
+        try:
+            reset = float(value)
+        except ValueError:
+            self.log.warning("Unexpected X-RateLimit-Reset value: %r", value)
+            return
+        # Seconds to reset can't be that large, it is Unix timestamp
+        if reset > 1e9:
+            reset -= time.time()
+        if reset > self.RATELIMIT_MAX_WAIT:
+            self.log.warning(
+                "Rate limit resets in %.0f seconds, not waiting for it", reset
+            )
+            return
+        self._ratelimit_until = time.monotonic() + max(reset, 0)
+
+    def _parse_json(self, response: requests.Response):
+        """Decode JSON response body. Use fastest available JSON parser."""
+        return json_loads(response.content)
+
     def _format_headers(self, headers: dict) -> str:
         """Format HTTP headers for log."""
         return "\n".join(f"{k}: {v}" for k, v in headers.items())
 
-    def _secure_log(self, headers: dict) -> dict:
-        """Replace API access token with placeholder."""
+    def _redact_headers(self, headers: dict) -> dict:
+        """Return headers copy with API access token placeholder."""
         _headers = headers.copy()
         if self.hide_token:
             _headers["Authorization"] = "Bearer <SENSITIVE_DATA_DELETED>"
         return _headers
 
+    def _secure_log(self, headers: dict) -> dict:
+        """Replace API access token with placeholder. Client default headers
+        are redacted once in __init__().
+        """
+        if headers is self.headers:
+            return self._redacted_headers
+        return self._redact_headers(headers)
+
     def _log_request(self, response: requests.Response) -> None:
         """Log HTTP requests."""
-        res_body = response.text or "<NO_BODY>"
-        req_body = response.request.body or "<NO_BODY>"
-        if isinstance(req_body, (bytes, bytearray)):
-            req_body = req_body.decode()
-
-        self.log.debug(
-            textwrap.dedent(
-                """
-            ---------------- Request ----------------
-            {req.method} {req.url}
-            {req_headers}
-
-            {req_body}
-            ---------------- Response ---------------
-            {res.status_code} {res.reason} {res.url}
-            {res_headers}
-
-            {res_body}"""
-            ).format(
-                req=response.request,
-                req_headers=self._format_headers(
-                    self._secure_log(response.request.headers)
-                ),
-                req_body=req_body,
-                res=response,
-                res_headers=self._format_headers(response.headers),
-                res_body=res_body,
-            )
-        )
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("%s", HTTPLogMessage(self, response))
+
+    def _encode_json(self, payload) -> bytes:
+        """Serialize request payload to JSON. UUIDs and IP addresses are
+        sent as strings, other unsupported values raise TypeError.
+        """
+        if orjson_dumps:
+            return orjson_dumps(payload, default=json_default)
+        return _json.dumps(payload, default=json_default).encode()
 
     def _request(
         self,
@@ -104,20 +511,50 @@ class TimewebCloudBase:
         json: Optional[dict] = None,
         files: Optional[dict] = None,
         timeout: Optional[int] = None,
+        stream: bool = False,
     ) -> requests.Response:
-        """Make request and handle errors."""
+        """Make request and handle errors. `headers` are added to default
+        client headers and override them for this request only. With
+        `stream` response body is not downloaded until it is accessed
+        e.g. via `response.iter_content()`.
+        """
 
         if not timeout:
             timeout = self.timeout
 
-        if not headers:
-            headers = self.headers
+        if method != "GET":
+            with self._cache_lock:
+                self._cache.clear()
+                self._cache_generation += 1
+
+        # Client default headers are set on session once. Only request
+        # specific headers are passed here, session merges them.
+        if json is not None:
+            data = self._encode_json(json)
+            json = None
+            if headers:
+                headers = {**headers, **self.JSON_HEADERS}
+            else:
+                headers = self.JSON_HEADERS
 
-        _headers = self._secure_log(headers)
-        self.log.debug("Called with args: %s %s %s", method, url, _headers)
+        # Wait for rate limit reset instead of getting 429 in response
+        delay = self._ratelimit_until - time.monotonic()
+        if delay > 0:
+            self.log.warning("Rate limit exceeded, wait %.1f seconds", delay)
+            time.sleep(delay)
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "Called with args: %s %s %s",
+                method,
+                url,
+                self._secure_log(
+                    {**self.headers, **headers} if headers else self.headers
+                ),
+            )
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method,
                 url,
                 headers=headers,
@@ -126,9 +563,11 @@ class TimewebCloudBase:
                 json=json,
                 files=files,
                 timeout=timeout,
+                stream=stream,
             )
         except requests.exceptions.ConnectionError as conerr:
             raise exc.NetworkError(f"Coul'd not connect to server: {conerr}")
+        self._update_ratelimit(response)
 
         try:
             response.raise_for_status()
@@ -146,70 +585,17 @@ class TimewebCloudBase:
                 ) from e
 
             try:
-                error = exc.ErrResponse(**response.json())
-            except requests.JSONDecodeError as err:
+                error = exc.ErrResponse(**self._parse_json(response))
+            except ValueError as err:
                 raise exc.MalformedResponseError(
                     message="Response have no JSON schema or have invalid JSON syntax.",
                     request=e.request,
                     response=e.response,
                 ) from err
 
-            if response.status_code == 400:
-                raise exc.BadRequestError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 403:
-                raise exc.ForbiddenError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 404:
-                raise exc.NotFoundError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 409:
-                raise exc.ConflictError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 423:
-                raise exc.LockedError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 429:
-                raise exc.TooManyRequestsError(
-                    request=e.request,
-                    response=e.response,
-                    status_code=error.status_code,
-                    error_code=error.error_code,
-                    message=error.message,
-                    response_id=error.response_id,
-                ) from e
-            if response.status_code == 500:
-                raise exc.InternalServerError(
+            exc_class = STATUS_TO_EXCEPTION.get(response.status_code)
+            if exc_class:
+                raise exc_class(
                     request=e.request,
                     response=e.response,
                     status_code=error.status_code,
@@ -1,7 +1,20 @@
 """Timeweb Cloud API client."""
 
-from typing import Optional, Union, List
-from uuid import UUID
+import io
+import json
+import os
+import warnings
+from functools import partial, lru_cache
+from typing import (
+    Optional,
+    Union,
+    List,
+    Dict,
+    Tuple,
+    BinaryIO,
+    Iterator,
+)
+from uuid import UUID, uuid4
 from pathlib import Path
 from ipaddress import IPv4Address, IPv6Address, IPv4Network, IPv6Network
 
@@ -30,23 +43,221 @@ from .types import (
 )
 
 
+# Resource types which can be linked to firewall group.
+FIREWALL_RESOURCE_TYPES = frozenset(("server", "dbaas", "balancer"))
+
+
+# Project resources endpoints names by resource type.
+PROJECT_RESOURCES = {
+    ResourceType.SERVER: "servers",
+    ResourceType.BALANCER: "balancers",
+    ResourceType.DATABASE: "databases",
+    ResourceType.CLUSTER: "clusters",
+    ResourceType.BUCKET: "buckets",
+    ResourceType.DEDICATED_SERVER: "dedicated",
+}
+
+# API issue: CLI boot mode names which differ from API ones.
+BOOT_MODE_ALIASES = {ServerBootMode.RECOVERY: "recovery_disk"}
+
+
+@lru_cache(maxsize=64)
+def _json_field(name: str, value: str) -> bytes:
+    """Return encoded JSON object with single string field. Used for
+    bodies like {"action": "start"} which have few possible values, so
+    every body is encoded only once. str-based Enum members are encoded
+    as their values.
+    """
+    return json.dumps({name: value}).encode()
+
+
+def _compact(**kwargs) -> dict:
+    """Return keyword arguments which values are not None."""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+def _compact_truthy(**kwargs) -> dict:
+    """Return keyword arguments which values are not empty. Drops None as
+    well as 0, False and empty strings.
+    """
+    return {key: value for key, value in kwargs.items() if value}
+
+
+class MultipartFile:
+    """File-like multipart/form-data request body with single file field.
+    File is read by chunks while request is being sent, so memory usage
+    doesn't depend on file size. Supports len(), tell() and seek() which
+    are used for Content-Length and to rewind body on retries.
+    """
+
+    def __init__(self, fileobj: BinaryIO, filename: str, field: str = "file"):
+        boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; '
+            f'filename="{filename}"\r\n\r\n'
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+        self._sizes = [
+            len(head),
+            os.fstat(fileobj.fileno()).st_size,
+            len(tail),
+        ]
+        self._length = sum(self._sizes)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only absolute seek is supported")
+        start = 0
+        for part, size in zip(self._parts, self._sizes):
+            part.seek(min(max(offset - start, 0), size))
+            start += size
+        self._pos = offset
+        return offset
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length - self._pos
+        chunks = []
+        start = 0
+        for part, part_size in zip(self._parts, self._sizes):
+            end = start + part_size
+            if size and self._pos < end:
+                want = min(size, end - self._pos)
+                chunk = part.read(want)
+                chunks.append(chunk)
+                self._pos += len(chunk)
+                size -= len(chunk)
+                if len(chunk) < want:
+                    break
+            start = end
+        return b"".join(chunks)
+
+
 class TimewebCloud(TimewebCloudBase):
     """Timeweb Cloud API client class."""
 
+    # URL templates of API endpoints, see TimewebCloudBase.__init__()
+    ENDPOINTS = {
+        "account_status": "/account/status",
+        "account_finances": "/account/finances",
+        "auth_access": "/auth/access",
+        "servers": "/servers",
+        "server": "/servers/{}",
+        "server_action": "/servers/{}/action",
+        "server_clone": "/servers/{}/clone",
+        "server_logs": "/servers/{}/logs",
+        "server_boot_mode": "/servers/{}/boot-mode",
+        "server_nat_mode": "/servers/{}/local-networks/nat-mode",
+        "server_ips": "/servers/{}/ips",
+        "server_ssh_keys": "/servers/{}/ssh-keys",
+        "server_ssh_key": "/servers/{}/ssh-keys/{}",
+        "server_configurators": "/configurator/servers",
+        "server_presets": "/presets/servers",
+        "server_os_images": "/os/servers",
+        "server_software": "/software/servers",
+        "disks": "/servers/{}/disks",
+        "disk": "/servers/{}/disks/{}",
+        "disk_backups": "/servers/{}/disks/{}/backups",
+        "disk_backup": "/servers/{}/disks/{}/backups/{}",
+        "disk_backup_action": "/servers/{}/disks/{}/backups/{}/action",
+        "disk_autobackups": "/servers/{}/disks/{}/auto-backups",
+        "ssh_keys": "/ssh-keys",
+        "ssh_key": "/ssh-keys/{}",
+        "images": "/images",
+        "image": "/images/{}",
+        "projects": "/projects",
+        "project": "/projects/{}",
+        "project_all_resources": "/projects/{}/resources",
+        "project_transfer": "/projects/{}/resources/transfer",
+        "dbs": "/dbs",
+        "db": "/dbs/{}",
+        "db_backups": "/dbs/{}/backups",
+        "db_backup": "/dbs/{}/backups/{}",
+        "db_presets": "/presets/dbs",
+        "project_resources": "/projects/{}/resources/{}",
+        "buckets": "/storages/buckets",
+        "bucket": "/storages/buckets/{}",
+        "bucket_subdomains": "/storages/buckets/{}/subdomains",
+        "bucket_transfer_status": "/storages/buckets/{}/transfer-status",
+        "storage_users": "/storages/users",
+        "storage_user": "/storages/users/{}",
+        "storage_transfer": "/storages/transfer",
+        "storage_certificates": "/storages/certificates/generate",
+        "storage_presets": "/presets/storages",
+        "balancers": "/balancers",
+        "balancer": "/balancers/{}",
+        "balancer_ips": "/balancers/{}/ips",
+        "balancer_rules": "/balancers/{}/rules",
+        "balancer_rule": "/balancers/{}/rules/{}",
+        "balancer_presets": "/presets/balancers",
+        "k8s_clusters": "/k8s/clusters",
+        "k8s_cluster": "/k8s/clusters/{}",
+        "k8s_groups": "/k8s/clusters/{}/groups",
+        "k8s_group": "/k8s/clusters/{}/groups/{}",
+        "k8s_group_nodes": "/k8s/clusters/{}/groups/{}/nodes",
+        "k8s_nodes": "/k8s/clusters/{}/nodes",
+        "k8s_node": "/k8s/clusters/{}/nodes/{}",
+        "k8s_kubeconfig": "/k8s/clusters/{}/kubeconfig",
+        "k8s_resources": "/k8s/clusters/{}/resources",
+        "k8s_versions": "/k8s/k8s_versions",
+        "k8s_network_drivers": "/k8s/network_drivers",
+        "k8s_presets": "/presets/k8s",
+        "domains": "/domains",
+        "domain": "/domains/{}",
+        "domain_records": "/domains/{}/dns-records",
+        "domain_record": "/domains/{}/dns-records/{}",
+        "subdomain": "/domains/{}/subdomains/{}",
+        "add_domain": "/add-domain/{}",
+        "firewall_groups": "/firewall/groups",
+        "firewall_group": "/firewall/groups/{}",
+        "firewall_group_resources": "/firewall/groups/{}/resources",
+        "firewall_group_resource": "/firewall/groups/{}/resources/{}",
+        "firewall_rules": "/firewall/groups/{}/rules",
+        "firewall_rule": "/firewall/groups/{}/rules/{}",
+        "firewall_service": "/firewall/service/{}/{}",
+    }
+    ENDPOINTS_V1 = {
+        "floating_ips": "/floating-ips",
+        "floating_ip": "/floating-ips/{}",
+        "floating_ip_bind": "/floating-ips/{}/bind",
+        "floating_ip_unbind": "/floating-ips/{}/unbind",
+        "vpc_v1": "/vpcs/{}",
+        "vpc_ports": "/vpcs/{}/ports",
+    }
+    ENDPOINTS_V2 = {
+        "vpcs": "/vpcs",
+        "vpc": "/vpcs/{}",
+        "vpc_services": "/vpcs/{}/services",
+    }
+
+    # Cache lifetime in seconds for rarely changing catalog data.
+    CATALOG_TTL = 6 * 3600
+    CONFIGURATORS_TTL = 3600
+
     # -----------------------------------------------------------------------
     # Account
 
     def get_account_status(self):
         """Return Timeweb Cloud account status."""
-        return self._request("GET", f"{self.api_url}/account/status")
+        return self._request("GET", self._ep["account_status"]())
 
     def get_account_finances(self):
         """Return finances."""
-        return self._request("GET", f"{self.api_url}/account/finances")
+        return self._request("GET", self._ep["account_finances"]())
 
     def get_account_restrictions(self):
         """Return account access restrictions info."""
-        return self._request("GET", f"{self.api_url}/auth/access")
+        return self._request("GET", self._ep["auth_access"]())
 
     # -----------------------------------------------------------------------
     # Cloud Servers
@@ -54,11 +265,15 @@ class TimewebCloud(TimewebCloudBase):
     def get_servers(self, limit: int = 100, offset: int = 0):
         """Get list of Cloud Server objects."""
         params = {"limit": limit, "offset": offset}
-        return self._request("GET", f"{self.api_url}/servers", params=params)
+        return self._revalidated_get(self._ep["servers"](), params=params)
+
+    def iter_servers(self, page_size: int = 100) -> Iterator[dict]:
+        """Iterate over all Cloud Servers. Pages are fetched concurrently."""
+        return self._iter_pages(self.get_servers, "servers", page_size)
 
     def get_server(self, server_id: int):
         """Get Cloud Server object."""
-        return self._request("GET", f"{self.api_url}/servers/{server_id}")
+        return self._revalidated_get(self._ep["server"](server_id))
 
     def create_server(
         self,
@@ -72,17 +287,29 @@ class TimewebCloud(TimewebCloudBase):
         avatar_id: Optional[str] = None,
         software_id: Optional[int] = None,
         ssh_keys_ids: Optional[List[int]] = None,
-        is_local_network: Optional[bool] = None,  # deprecated
         is_ddos_guard: bool = False,
         network: Optional[dict] = None,
         availability_zone: Optional[ServiceAvailabilityZone] = None,
+        **kwargs,
     ):
         """Create new Cloud Server. Note:
 
         - configuration and preset_id is mutually exclusive.
         - os_id and image_id is mutually exclusive.
         - Location depends on configurator.location or preset.location.
+        - is_local_network is deprecated, use network instead.
         """
+        is_local_network = kwargs.pop("is_local_network", None)
+        if kwargs:
+            raise TypeError(
+                f"create_server() got unexpected arguments: {list(kwargs)}"
+            )
+        if is_local_network is not None:
+            warnings.warn(
+                "is_local_network is deprecated, use network instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         if not configuration and not preset_id:
             raise ValueError(
                 "One of parameters is required: configuration, preset_id"
@@ -90,32 +317,24 @@ class TimewebCloud(TimewebCloudBase):
         if not os_id and not image_id:
             raise ValueError("One of parameters is required: os_id, image_id")
 
-        payload = {
-            "name": name,
-            "bandwidth": bandwidth,
-            **({"comment": comment} if comment else {}),
-            **({"avatar_id": avatar_id} if avatar_id else {}),
-            **({"software_id": software_id} if software_id else {}),
-            **({"ssh_keys_ids": ssh_keys_ids} if ssh_keys_ids else {}),
-            "is_ddos_guard": is_ddos_guard,
-            **(
-                {"is_local_network": is_local_network}
-                if is_local_network is not None
-                else {}
-            ),
-            **({"network": network} if network else {}),
-            **({"configuration": configuration} if configuration else {}),
-            **({"preset_id": preset_id} if preset_id else {}),
-            **({"os_id": os_id} if os_id else {}),
-            **({"image_id": image_id} if image_id else {}),
-            **(
-                {"availability_zone": str(availability_zone)}
-                if availability_zone
-                else {}
-            ),
-        }
-
-        return self._request("POST", f"{self.api_url}/servers", json=payload)
+        payload = _compact_truthy(
+            comment=comment,
+            avatar_id=avatar_id,
+            software_id=software_id,
+            ssh_keys_ids=ssh_keys_ids,
+            network=network,
+            configuration=configuration,
+            preset_id=preset_id,
+            os_id=os_id,
+            image_id=image_id,
+            availability_zone=availability_zone,
+        )
+        payload["name"] = name
+        payload["bandwidth"] = bandwidth
+        payload["is_ddos_guard"] = is_ddos_guard
+        payload.update(_compact(is_local_network=is_local_network))
+
+        return self._request("POST", self._ep["servers"](), json=payload)
 
     def delete_server(
         self,
@@ -124,13 +343,11 @@ class TimewebCloud(TimewebCloudBase):
         code: Optional[int] = None,
     ):
         """Delete Cloud Server by ID."""
-        params = {
-            **({"hash": delete_hash} if delete_hash else {}),
-            **({"code": code} if code else {}),
-        }
+        params = _compact_truthy(hash=delete_hash)
+        params.update(_compact(code=code))
         return self._request(
             "DELETE",
-            f"{self.api_url}/servers/{server_id}",
+            self._ep["server"](server_id),
             params=params,
         )
 
@@ -152,21 +369,21 @@ class TimewebCloud(TimewebCloudBase):
         - configuration and preset_id is mutually exclusive.
         - os_id and image_id is mutually exclusive.
         """
-        payload = {
-            **({"name": name} if name else {}),
-            **({"bandwidth": bandwidth} if bandwidth else {}),
+        payload = _compact_truthy(
+            name=name,
+            bandwidth=bandwidth,
             # API issue: Non-consistent name: 'configurator' must be named 'configuration'
-            **({"configurator": configuration} if configuration else {}),
-            **({"preset_id": preset_id} if preset_id else {}),
-            **({"os_id": os_id} if os_id else {}),
-            **({"image_id": image_id} if image_id else {}),
-            **({"software_id": software_id} if software_id else {}),
-            **({"comment": comment} if comment else {}),
-            **({"avatar_id": avatar_id} if avatar_id else {}),
-        }
+            configurator=configuration,
+            preset_id=preset_id,
+            os_id=os_id,
+            image_id=image_id,
+            software_id=software_id,
+            comment=comment,
+            avatar_id=avatar_id,
+        )
         return self._request(
             "PATCH",
-            f"{self.api_url}/servers/{server_id}",
+            self._ep["server"](server_id),
             json=payload,
         )
 
@@ -174,8 +391,9 @@ class TimewebCloud(TimewebCloudBase):
         """Do action with Cloud Server. API returns HTTP 204 on success."""
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/action",
-            json={"action": action},
+            self._ep["server_action"](server_id),
+            data=_json_field("action", action),
+            headers=self.JSON_HEADERS,
         )
 
     def clone_server(self, server_id: int):
@@ -183,24 +401,44 @@ class TimewebCloud(TimewebCloudBase):
         Make copy of existing server and return clone object.
         """
         return self._request(
-            "POST", f"{self.api_url}/servers/{server_id}/clone", json={}
+            "POST", self._ep["server_clone"](server_id), json={}
         )
 
     def get_server_configurators(self):
         """List configurators."""
-        return self._request("GET", f"{self.api_url}/configurator/servers")
+        return self._cached_get(
+            self._ep["server_configurators"](), ttl=self.CONFIGURATORS_TTL
+        )
 
     def get_server_presets(self):
         """List available server configuration presets."""
-        return self._request("GET", f"{self.api_url}/presets/servers")
+        return self._cached_get(
+            self._ep["server_presets"](), ttl=self.CATALOG_TTL
+        )
 
     def get_server_os_images(self):
         """List available prebuilt operating system images."""
-        return self._request("GET", f"{self.api_url}/os/servers")
+        return self._cached_get(
+            self._ep["server_os_images"](), ttl=self.CATALOG_TTL
+        )
 
     def get_server_software(self):
         """List available software."""
-        return self._request("GET", f"{self.api_url}/software/servers")
+        return self._cached_get(
+            self._ep["server_software"](), ttl=self.CATALOG_TTL
+        )
+
+    def prefetch_catalog(self) -> None:
+        """Fetch Cloud Servers catalog: configurators, presets, OS images
+        and software concurrently. Responses are cached, so following calls
+        of these methods don't make requests.
+        """
+        self._gather(
+            self.get_server_configurators,
+            self.get_server_presets,
+            self.get_server_os_images,
+            self.get_server_software,
+        )
 
     def get_server_logs(
         self,
@@ -213,26 +451,39 @@ class TimewebCloud(TimewebCloudBase):
         params = {"limit": limit, "offset": offset, "order": order}
         return self._request(
             "GET",
-            f"{self.api_url}/servers/{server_id}/logs",
+            self._ep["server_logs"](server_id),
             params=params,
         )
 
+    def iter_server_logs(
+        self, server_id: int, order: ServerLogOrder, page_size: int = 100
+    ) -> Iterator[dict]:
+        """Iterate over all Cloud Server events log entries."""
+        return self._iter_pages(
+            self.get_server_logs,
+            "server_logs",
+            page_size,
+            server_id=server_id,
+            order=order,
+        )
+
     def set_server_boot_mode(self, server_id: int, boot_mode: ServerBootMode):
         """Change Cloud Server boot mode."""
-        if boot_mode == "recovery":
-            boot_mode = "recovery_disk"
+        boot_mode = BOOT_MODE_ALIASES.get(boot_mode) or boot_mode
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/boot-mode",
-            json={"boot_mode": boot_mode},
+            self._ep["server_boot_mode"](server_id),
+            data=_json_field("boot_mode", boot_mode),
+            headers=self.JSON_HEADERS,
         )
 
     def set_server_nat_mode(self, server_id: int, nat_mode: ServerNATMode):
         """Change Cloud Server NAT mode. Available only for servers with LAN."""
         return self._request(
             "PATCH",
-            f"{self.api_url}/servers/{server_id}/local-networks/nat-mode",
-            json={"nat_mode": nat_mode},
+            self._ep["server_nat_mode"](server_id),
+            data=_json_field("nat_mode", nat_mode),
+            headers=self.JSON_HEADERS,
         )
 
     # -----------------------------------------------------------------------
@@ -240,7 +491,7 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_ips(self, server_id: int):
         """Get list of Cloud Server public IPs."""
-        return self._request("GET", f"{self.api_url}/servers/{server_id}/ips")
+        return self._request("GET", self._ep["server_ips"](server_id))
 
     def add_ip(
         self, server_id: int, version: IPVersion, ptr: Optional[str] = None
@@ -248,7 +499,7 @@ class TimewebCloud(TimewebCloudBase):
         """Add new public IP to Cloud Server."""
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/ips",
+            self._ep["server_ips"](server_id),
             json={"type": version, "ptr": ptr},
         )
 
@@ -257,7 +508,7 @@ class TimewebCloud(TimewebCloudBase):
         # pylint: disable=invalid-name
         return self._request(
             "DELETE",
-            f"{self.api_url}/servers/{server_id}/ips",
+            self._ep["server_ips"](server_id),
             json={"ip": ip},
         )
 
@@ -268,7 +519,7 @@ class TimewebCloud(TimewebCloudBase):
         # pylint: disable=invalid-name
         return self._request(
             "PATCH",
-            f"{self.api_url}/servers/{server_id}/ips",
+            self._ep["server_ips"](server_id),
             json={"ip": ip, "ptr": ptr},
         )
 
@@ -277,23 +528,22 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_disks(self, server_id: int):
         """List Cloud Server disks."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/servers/{server_id}/disks",
+        return self._revalidated_get(
+            self._ep["disks"](server_id),
         )
 
     def get_disk(self, server_id: int, disk_id: int):
         """Get disk."""
         return self._request(
             "GET",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}",
+            self._ep["disk"](server_id, disk_id),
         )
 
     def add_disk(self, server_id: int, size: int):
         """Add new disk to Cloud Server."""
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/disks",
+            self._ep["disks"](server_id),
             json={"size": size},
         )
 
@@ -301,7 +551,7 @@ class TimewebCloud(TimewebCloudBase):
         """Resize disk."""
         return self._request(
             "PATCH",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}",
+            self._ep["disk"](server_id, disk_id),
             json={"size": size},
         )
 
@@ -309,14 +559,14 @@ class TimewebCloud(TimewebCloudBase):
         """Permanently delete disk. Cannot delete system disk."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}",
+            self._ep["disk"](server_id, disk_id),
         )
 
     def get_disk_autobackup_settings(self, server_id: int, disk_id: int):
         """Return disk auto-backup settings."""
         return self._request(
             "GET",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}/auto-backups",
+            self._ep["disk_autobackups"](server_id, disk_id),
         )
 
     def update_disk_autobackup_settings(
@@ -330,20 +580,21 @@ class TimewebCloud(TimewebCloudBase):
         day_of_week: Optional[int] = None,
     ):
         """Update disk auto-backup settings."""
-        payload = {
-            **({"is_enabled": is_enabled} if is_enabled is not None else {}),
-            **({"copy_count": copy_count} if copy_count else {}),
-            **(
-                {"creation_start_at": creation_start_at}
-                if creation_start_at
-                else {}
-            ),
-            **({"interval": interval} if interval else {}),
-            **({"day_of_week": day_of_week} if day_of_week else {}),
-        }
+        payload = _compact_truthy(
+            copy_count=copy_count,
+            creation_start_at=creation_start_at,
+            interval=interval,
+            day_of_week=day_of_week,
+        )
+        payload.update(_compact(is_enabled=is_enabled))
+        if not payload:
+            raise ValueError(
+                "One of parameters is required: is_enabled, copy_count, "
+                "creation_start_at, interval, day_of_week"
+            )
         return self._request(
             "PATCH",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}/auto-backups",
+            self._ep["disk_autobackups"](server_id, disk_id),
             json=payload,
         )
 
@@ -352,17 +603,13 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_disk_backups(self, server_id: int, disk_id: int):
         """Get backups list of server disk."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}/backups",
+        return self._revalidated_get(
+            self._ep["disk_backups"](server_id, disk_id),
         )
 
     def get_disk_backup(self, server_id: int, disk_id: int, backup_id: int):
         """Get disk backup."""
-        url = (
-            f"{self.api_url}/servers/{server_id}"
-            + f"/disks/{disk_id}/backups/{backup_id}"
-        )
+        url = self._ep["disk_backup"](server_id, disk_id, backup_id)
         return self._request("GET", url)
 
     def create_disk_backup(
@@ -371,7 +618,7 @@ class TimewebCloud(TimewebCloudBase):
         """Create new backup."""
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/disks/{disk_id}/backups",
+            self._ep["disk_backups"](server_id, disk_id),
             json={"comment": comment},
         )
 
@@ -383,18 +630,12 @@ class TimewebCloud(TimewebCloudBase):
         comment: Optional[str] = None,
     ):
         """Update backup properties."""
-        url = (
-            f"{self.api_url}/servers/{server_id}"
-            + f"/disks/{disk_id}/backups/{backup_id}"
-        )
+        url = self._ep["disk_backup"](server_id, disk_id, backup_id)
         return self._request("PATCH", url, json={"comment": comment})
 
     def delete_disk_backup(self, server_id: int, disk_id: int, backup_id: int):
         """Delete backup."""
-        url = (
-            f"{self.api_url}/servers/{server_id}"
-            + f"/disks/{disk_id}/backups/{backup_id}"
-        )
+        url = self._ep["disk_backup"](server_id, disk_id, backup_id)
         return self._request("DELETE", url)
 
     def do_action_with_disk_backup(
@@ -405,27 +646,29 @@ class TimewebCloud(TimewebCloudBase):
         action: BackupAction,
     ):
         """Perform action with backup."""
-        url = (
-            f"{self.api_url}/servers/{server_id}"
-            + f"/disks/{disk_id}/backups/{backup_id}/action"
+        url = self._ep["disk_backup_action"](server_id, disk_id, backup_id)
+        return self._request(
+            "POST",
+            url,
+            data=_json_field("action", action),
+            headers=self.JSON_HEADERS,
         )
-        return self._request("POST", url, json={"action": action})
 
     # -----------------------------------------------------------------------
     # SSH-keys
 
     def get_ssh_keys(self):
         """Get list of SSH-keys."""
-        return self._request("GET", f"{self.api_url}/ssh-keys")
+        return self._revalidated_get(self._ep["ssh_keys"]())
 
     def get_ssh_key(self, ssh_key_id: int):
         """Get SSH-key by ID."""
-        return self._request("GET", f"{self.api_url}/ssh-keys/{ssh_key_id}")
+        return self._request("GET", self._ep["ssh_key"](ssh_key_id))
 
     def add_new_ssh_key(self, name: str, body: str, is_default: bool = False):
         """Add new SSH-key."""
         payload = {"name": name, "body": body, "is_default": is_default}
-        return self._request("POST", f"{self.api_url}/ssh-keys", json=payload)
+        return self._request("POST", self._ep["ssh_keys"](), json=payload)
 
     def update_ssh_key(
         self,
@@ -435,26 +678,23 @@ class TimewebCloud(TimewebCloudBase):
         is_default: Optional[bool] = None,
     ):
         """Update an existing SSH-key."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"body": body} if body else {}),
-            **({"is_default": is_default} if is_default is not None else {}),
-        }
+        payload = _compact_truthy(name=name, body=body)
+        payload.update(_compact(is_default=is_default))
         return self._request(
             "PATCH",
-            f"{self.api_url}/ssh-keys/{ssh_key_id}",
+            self._ep["ssh_key"](ssh_key_id),
             json=payload,
         )
 
     def delete_ssh_key(self, ssh_key_id: int):
         """Delete SSH-key by ID."""
-        return self._request("DELETE", f"{self.api_url}/ssh-keys/{ssh_key_id}")
+        return self._request("DELETE", self._ep["ssh_key"](ssh_key_id))
 
     def add_ssh_key_to_server(self, server_id: int, ssh_keys_ids: list):
         """Add SSH-keys to Cloud Server."""
         return self._request(
             "POST",
-            f"{self.api_url}/servers/{server_id}/ssh-keys",
+            self._ep["server_ssh_keys"](server_id),
             # API issue: Non-consistent name: 'ssh_key_ids' must be named 'ssh_keys_ids'
             json={"ssh_key_ids": ssh_keys_ids},
         )
@@ -463,7 +703,7 @@ class TimewebCloud(TimewebCloudBase):
         """Delete SSH-key from Cloud Server."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/servers/{server_id}/ssh-keys/{ssh_key_id}",
+            self._ep["server_ssh_key"](server_id, ssh_key_id),
         )
 
     # -----------------------------------------------------------------------
@@ -475,11 +715,15 @@ class TimewebCloud(TimewebCloudBase):
             "limit": limit,
             "offset": offset,
         }
-        return self._request("GET", f"{self.api_url}/images", params=params)
+        return self._revalidated_get(self._ep["images"](), params=params)
+
+    def iter_images(self, page_size: int = 100) -> Iterator[dict]:
+        """Iterate over all images. Pages are fetched concurrently."""
+        return self._iter_pages(self.get_images, "images", page_size)
 
     def get_image(self, image_id: UUID):
         """Get image."""
-        return self._request("GET", f"{self.api_url}/images/{image_id}")
+        return self._request("GET", self._ep["image"](image_id))
 
     def create_image(
         self,
@@ -493,15 +737,15 @@ class TimewebCloud(TimewebCloudBase):
         """Create disk image. disk_id and upload_url is mutually exclusive.
         disk_id or upload_url is required.
         """
-        payload = {
-            **({"disk_id": disk_id} if disk_id else {}),
-            **({"name": name} if name else {}),
-            **({"description": description} if description else {}),
-            **({"os": os_type} if os_type else {}),
-            **({"location": location} if location else {}),
-            **({"upload_url": upload_url} if upload_url else {}),
-        }
-        return self._request("POST", f"{self.api_url}/images", json=payload)
+        payload = _compact_truthy(
+            disk_id=disk_id,
+            name=name,
+            description=description,
+            os=os_type,
+            location=location,
+            upload_url=upload_url,
+        )
+        return self._request("POST", self._ep["images"](), json=payload)
 
     def update_image(
         self,
@@ -510,41 +754,47 @@ class TimewebCloud(TimewebCloudBase):
         description: Optional[str] = None,
     ):
         """Update image properties."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"description": description} if description else {}),
-        }
+        payload = _compact_truthy(name=name, description=description)
+        if not payload:
+            raise ValueError(
+                "One of parameters is required: name, description"
+            )
         return self._request(
             "PATCH",
-            f"{self.api_url}/images/{image_id}",
+            self._ep["image"](image_id),
             json=payload,
         )
 
     def upload_image(self, image_id: UUID, filename: Path):
-        """Upload image to storage."""
-        self.headers.update({"Content-Type": "multipart/form-data"})
-        self.headers.update({"Content-Disposition": filename})
+        """Upload image to storage. File is streamed from disk."""
+        name = Path(filename).name
         with open(filename, "rb") as image:
+            body = MultipartFile(image, name)
+            headers = {
+                "Content-Type": body.content_type,
+                "Content-Disposition": f'attachment; filename="{name}"',
+            }
             return self._request(
                 "POST",
-                f"{self.api_url}/images/{image_id}",
-                files={"file": image},
+                self._ep["image"](image_id),
+                headers=headers,
+                data=body,
             )
 
     def delete_image(self, image_id: UUID):
         """Remove image."""
-        return self._request("DELETE", f"{self.api_url}/images/{image_id}")
+        return self._request("DELETE", self._ep["image"](image_id))
 
     # -----------------------------------------------------------------------
     # Projects
 
     def get_projects(self):
         """Get account projects list."""
-        return self._request("GET", f"{self.api_url}/projects")
+        return self._revalidated_get(self._ep["projects"]())
 
     def get_project(self, project_id: int):
         """Get account project by ID."""
-        return self._request("GET", f"{self.api_url}/projects/{project_id}")
+        return self._request("GET", self._ep["project"](project_id))
 
     def create_project(
         self,
@@ -558,7 +808,7 @@ class TimewebCloud(TimewebCloudBase):
             "description": description,
             "avatar_id": avatar_id,
         }
-        return self._request("POST", f"{self.api_url}/projects", json=payload)
+        return self._request("POST", self._ep["projects"](), json=payload)
 
     def update_project(
         self,
@@ -568,20 +818,24 @@ class TimewebCloud(TimewebCloudBase):
         avatar_id: Optional[int] = None,
     ):
         """Update project properties."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"description": description} if description else {}),
-            **({"avatar_id": avatar_id} if avatar_id else {}),
-        }
+        payload = _compact_truthy(
+            name=name, description=description, avatar_id=avatar_id
+        )
+        if not payload:
+            raise ValueError(
+                "One of parameters is required: name, description, avatar_id"
+            )
+        # API issue: Project is updated with PUT, but it has PATCH semantics:
+        # fields omitted in payload are left as is. There is no PATCH method.
         return self._request(
             "PUT",
-            f"{self.api_url}/projects/{project_id}",
+            self._ep["project"](project_id),
             json=payload,
         )
 
     def delete_project(self, project_id: int):
         """Delete project by ID."""
-        return self._request("DELETE", f"{self.api_url}/projects/{project_id}")
+        return self._request("DELETE", self._ep["project"](project_id))
 
     def move_resource_to_project(
         self,
@@ -598,107 +852,151 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "PUT",
-            f"{self.api_url}/projects/{from_project}/resources/transfer",
+            self._ep["project_transfer"](from_project),
             json=payload,
         )
 
     def get_project_resources(self, project_id: int):
         """Get all project resources."""
+        return self._revalidated_get(
+            self._ep["project_all_resources"](project_id),
+        )
+
+    def get_project_resources_by_type(
+        self, project_id: int, resource_type: ResourceType
+    ):
+        """List project resources of given type."""
         return self._request(
             "GET",
-            f"{self.api_url}/projects/{project_id}/resources",
+            self._ep["project_resources"](
+                project_id, PROJECT_RESOURCES[resource_type]
+            ),
         )
 
     def get_project_balancers(self, project_id: int):
         """List balancers in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/balancers",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.BALANCER
         )
 
     def get_project_buckets(self, project_id: int):
         """List buckets in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/buckets",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.BUCKET
         )
 
     def get_project_clusters(self, project_id: int):
         """List Kubernetes clusters in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/clusters",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.CLUSTER
         )
 
     def get_project_databases(self, project_id: int):
         """List managed databases in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/databases",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.DATABASE
         )
 
     def get_project_servers(self, project_id: int):
         """List servers in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/servers",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.SERVER
         )
 
     def get_project_dedicated_servers(self, project_id: int):
         """List dedicated servers in project by project_id."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/projects/{project_id}/resources/dedicated",
+        return self.get_project_resources_by_type(
+            project_id, ResourceType.DEDICATED_SERVER
         )
 
-    def add_balancer_to_project(self, resource_id: int, project_id: int):
-        """Add load balancer to project."""
+    def get_project_overview(self, project_id: int):
+        """Get project resources of every type concurrently. Return dict
+        with responses keyed by resource type.
+        """
+        kinds = {
+            "balancers": ResourceType.BALANCER,
+            "buckets": ResourceType.BUCKET,
+            "clusters": ResourceType.CLUSTER,
+            "databases": ResourceType.DATABASE,
+            "servers": ResourceType.SERVER,
+            "dedicated_servers": ResourceType.DEDICATED_SERVER,
+        }
+        responses = self._gather(
+            *(
+                partial(self.get_project_resources_by_type, project_id, kind)
+                for kind in kinds.values()
+            )
+        )
+        return dict(zip(kinds, responses))
+
+    def add_resource_to_project(
+        self, resource_type: ResourceType, resource_id: int, project_id: int
+    ):
+        """Add resource of given type to project."""
         return self._request(
             "POST",
-            f"{self.api_url}/projects/{project_id}/resources/balancers",
+            self._ep["project_resources"](
+                project_id, PROJECT_RESOURCES[resource_type]
+            ),
             json={"resource_id": resource_id},
         )
 
+    def add_balancer_to_project(self, resource_id: int, project_id: int):
+        """Add load balancer to project."""
+        return self.add_resource_to_project(
+            ResourceType.BALANCER, resource_id, project_id
+        )
+
     def add_bucket_to_project(self, resource_id: int, project_id: int):
         """Add object storage bucket to project."""
-        return self._request(
-            "POST",
-            f"{self.api_url}/projects/{project_id}/resources/buckets",
-            json={"resource_id": resource_id},
+        return self.add_resource_to_project(
+            ResourceType.BUCKET, resource_id, project_id
         )
 
     def add_cluster_to_project(self, resource_id: int, project_id: int):
         """Add Kubernetes cluster to project."""
-        return self._request(
-            "POST",
-            f"{self.api_url}/projects/{project_id}/resources/clusters",
-            json={"resource_id": resource_id},
+        return self.add_resource_to_project(
+            ResourceType.CLUSTER, resource_id, project_id
         )
 
     def add_server_to_project(self, resource_id: int, project_id: int):
         """Add Cloud Server to project."""
-        return self._request(
-            "POST",
-            f"{self.api_url}/projects/{project_id}/resources/servers",
-            json={"resource_id": resource_id},
+        return self.add_resource_to_project(
+            ResourceType.SERVER, resource_id, project_id
         )
 
     def add_database_to_project(self, resource_id: int, project_id: int):
         """Add managed database to project."""
-        return self._request(
-            "POST",
-            f"{self.api_url}/projects/{project_id}/resources/databases",
-            json={"resource_id": resource_id},
+        return self.add_resource_to_project(
+            ResourceType.DATABASE, resource_id, project_id
         )
 
     def add_dedicated_server_to_project(
         self, resource_id: int, project_id: int
     ):
         """Add dedicated server to project."""
-        return self._request(
-            "POST",
-            f"{self.api_url}/projects/{project_id}/resources/dedicated",
-            json={"resource_id": resource_id},
+        return self.add_resource_to_project(
+            ResourceType.DEDICATED_SERVER, resource_id, project_id
+        )
+
+    def add_resources_to_project(
+        self, project_id: int, resources: List[Tuple[ResourceType, int]]
+    ) -> list:
+        """Add many resources to project concurrently. `resources` is list
+        of (resource_type, resource_id) pairs. Return responses in the same
+        order, if request failed its exception is returned instead.
+        """
+        return self._gather(
+            *(
+                partial(
+                    self.add_resource_to_project,
+                    resource_type,
+                    resource_id,
+                    project_id,
+                )
+                for resource_type, resource_id in resources
+            ),
+            return_exceptions=True,
         )
 
     # -----------------------------------------------------------------------
@@ -707,15 +1005,19 @@ class TimewebCloud(TimewebCloudBase):
     def get_databases(self, limit: int = 100, offset: int = 0):
         """Get databases list."""
         params = {"limit": limit, "offset": offset}
-        return self._request("GET", f"{self.api_url}/dbs", params=params)
+        return self._revalidated_get(self._ep["dbs"](), params=params)
+
+    def iter_databases(self, page_size: int = 100) -> Iterator[dict]:
+        """Iterate over all databases. Pages are fetched concurrently."""
+        return self._iter_pages(self.get_databases, "dbs", page_size)
 
     def get_database(self, db_id: int):
         """Get database."""
-        return self._request("GET", f"{self.api_url}/dbs/{db_id}")
+        return self._request("GET", self._ep["db"](db_id))
 
     def get_database_presets(self):
         """Get database presets list."""
-        return self._request("GET", f"{self.api_url}/presets/dbs")
+        return self._cached_get(self._ep["db_presets"](), ttl=self.CATALOG_TTL)
 
     def create_database(
         self,
@@ -739,7 +1041,7 @@ class TimewebCloud(TimewebCloudBase):
             "preset_id": preset_id,
             "config_parameters": config_parameters,
         }
-        return self._request("POST", f"{self.api_url}/dbs", json=payload)
+        return self._request("POST", self._ep["dbs"](), json=payload)
 
     def update_database(
         self,
@@ -751,24 +1053,16 @@ class TimewebCloud(TimewebCloudBase):
         external_ip: Optional[bool] = None,
     ):
         """Update database."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"password": password} if password else {}),
-            **({"preset_id": preset_id} if preset_id else {}),
-            **(
-                {"config_parameters": config_parameters}
-                if config_parameters
-                else {}
-            ),
-            **(
-                {"is_external_ip": external_ip}
-                if external_ip is not None
-                else {}
-            ),
-        }
+        payload = _compact_truthy(
+            name=name,
+            password=password,
+            preset_id=preset_id,
+            config_parameters=config_parameters,
+        )
+        payload.update(_compact(is_external_ip=external_ip))
         return self._request(
             "PATCH",
-            f"{self.api_url}/dbs/{db_id}",
+            self._ep["db"](db_id),
             json=payload,
         )
 
@@ -779,36 +1073,39 @@ class TimewebCloud(TimewebCloudBase):
         code: Optional[int] = None,
     ):
         """Delete database."""
-        params = {
-            **({"hash": delete_hash} if delete_hash else {}),
-            **({"code": code} if code else {}),
-        }
-        return self._request(
-            "DELETE", f"{self.api_url}/dbs/{db_id}", params=params
-        )
+        params = _compact_truthy(hash=delete_hash)
+        params.update(_compact(code=code))
+        return self._request("DELETE", self._ep["db"](db_id), params=params)
 
     def get_database_backups(
         self, db_id: int, limit: int = 100, offset: int = 0
     ):
         """List database backups."""
-        return self._request(
-            "GET",
-            f"{self.api_url}/dbs/{db_id}/backups",
+        return self._revalidated_get(
+            self._ep["db_backups"](db_id),
             params={"limit": limit, "offset": offset},
         )
 
+    def iter_database_backups(
+        self, db_id: int, page_size: int = 100
+    ) -> Iterator[dict]:
+        """Iterate over all database backups."""
+        return self._iter_pages(
+            self.get_database_backups, "backups", page_size, db_id=db_id
+        )
+
     def get_database_backup(self, db_id: int, backup_id: int):
         """Get database backup."""
         return self._request(
             "GET",
-            f"{self.api_url}/dbs/{db_id}/backups/{backup_id}",
+            self._ep["db_backup"](db_id, backup_id),
         )
 
     def create_database_backup(self, db_id: int):
         """Create database backup."""
         return self._request(
             "POST",
-            f"{self.api_url}/dbs/{db_id}/backups",
+            self._ep["db_backups"](db_id),
             # API issue: Worst design: Send empty JSON for wut?
             json={},
         )
@@ -817,14 +1114,14 @@ class TimewebCloud(TimewebCloudBase):
         """Delete database backup."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/dbs/{db_id}/backups/{backup_id}",
+            self._ep["db_backup"](db_id, backup_id),
         )
 
     def restore_database_backup(self, db_id: int, backup_id: int):
         """Restore database backup."""
         return self._request(
             "PUT",
-            f"{self.api_url}/dbs/{db_id}/backups/{backup_id}",
+            self._ep["db_backup"](db_id, backup_id),
         )
 
     # -----------------------------------------------------------------------
@@ -832,11 +1129,13 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_storage_presets(self):
         """Get storage presets list."""
-        return self._request("GET", f"{self.api_url}/presets/storages")
+        return self._cached_get(
+            self._ep["storage_presets"](), ttl=self.CATALOG_TTL
+        )
 
     def get_buckets(self):
         """Get buckets list."""
-        return self._request("GET", f"{self.api_url}/storages/buckets")
+        return self._request("GET", self._ep["buckets"]())
 
     def create_bucket(
         self, name: str, preset_id: int, is_public: bool = False
@@ -849,7 +1148,7 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "POST",
-            f"{self.api_url}/storages/buckets",
+            self._ep["buckets"](),
             json=payload,
         )
 
@@ -860,13 +1159,11 @@ class TimewebCloud(TimewebCloudBase):
         code: Optional[int] = None,
     ):
         """Delete storage bucket."""
-        params = {
-            **({"hash": delete_hash} if delete_hash else {}),
-            **({"code": code} if code else {}),
-        }
+        params = _compact_truthy(hash=delete_hash)
+        params.update(_compact(code=code))
         return self._request(
             "DELETE",
-            f"{self.api_url}/storages/buckets/{bucket_id}",
+            self._ep["bucket"](bucket_id),
             params=params,
         )
 
@@ -877,30 +1174,24 @@ class TimewebCloud(TimewebCloudBase):
         is_public: Optional[bool] = None,
     ):
         """Update storage bucket."""
-        self.headers.update({"Content-Type": "application/json"})
-        payload = {
-            **({"preset_id": preset_id} if preset_id else {}),
-            **(
-                {"bucket_type": "public" if is_public else "private"}
-                if is_public is not None
-                else {}
-            ),
-        }
+        payload = _compact_truthy(preset_id=preset_id)
+        if is_public is not None:
+            payload["bucket_type"] = "public" if is_public else "private"
         return self._request(
             "PATCH",
-            f"{self.api_url}/storages/buckets/{bucket_id}",
+            self._ep["bucket"](bucket_id),
             json=payload,
         )
 
     def get_storage_users(self):
         """Get storage users list."""
-        return self._request("GET", f"{self.api_url}/storages/users")
+        return self._request("GET", self._ep["storage_users"]())
 
     def update_storage_user_secret(self, user_id: int, secret_key: str):
         """Update storage user secret key."""
         return self._request(
             "PATCH",
-            f"{self.api_url}/storages/users/{user_id}",
+            self._ep["storage_user"](user_id),
             json={"secret_key": secret_key},
         )
 
@@ -908,7 +1199,7 @@ class TimewebCloud(TimewebCloudBase):
         """Get storage transfer status."""
         return self._request(
             "GET",
-            f"{self.api_url}/storages/buckets/{bucket_id}/transfer-status",
+            self._ep["bucket_transfer_status"](bucket_id),
         )
 
     def start_storage_transfer(
@@ -935,7 +1226,7 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "POST",
-            f"{self.api_url}/storages/transfer",
+            self._ep["storage_transfer"](),
             json=payload,
         )
 
@@ -943,22 +1234,34 @@ class TimewebCloud(TimewebCloudBase):
         """Get bucket subdomains list."""
         return self._request(
             "GET",
-            f"{self.api_url}/storages/buckets/{bucket_id}/subdomains",
+            self._ep["bucket_subdomains"](bucket_id),
         )
 
     def add_bucket_subdomains(self, bucket_id: int, subdomains: list):
         """Add subdomains to bucket."""
         return self._request(
             "POST",
-            f"{self.api_url}/storages/buckets/{bucket_id}/subdomains",
+            self._ep["bucket_subdomains"](bucket_id),
             json={"subdomains": subdomains},
         )
 
+    def batch_add_subdomains(self, groups: Dict[int, List[str]]):
+        """Add subdomains to several buckets. Sends one request per bucket
+        with all its subdomains, requests to different buckets are sent
+        concurrently. Prefer it to calling `add_bucket_subdomains()` for
+        each subdomain. Return dict with responses keyed by bucket ID.
+        """
+        responses = self.batch(
+            partial(self.add_bucket_subdomains, bucket_id, subdomains)
+            for bucket_id, subdomains in groups.items()
+        )
+        return dict(zip(groups, responses))
+
     def delete_bucket_subdomains(self, bucket_id: int, subdomains: list):
         """Delete bucket subdomains."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/storages/buckets/{bucket_id}/subdomains",
+            self._ep["bucket_subdomains"](bucket_id),
             json={"subdomains": subdomains},
         )
 
@@ -966,7 +1269,7 @@ class TimewebCloud(TimewebCloudBase):
         """Generate TLS certificate for subdomain attached to bucket."""
         return self._request(
             "POST",
-            f"{self.api_url}/storages/certificates/generate",
+            self._ep["storage_certificates"](),
             json={"subdomain": subdomain},
         )
 
@@ -975,11 +1278,11 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_load_balancers(self):
         """Get load balancers list."""
-        return self._request("GET", f"{self.api_url}/balancers")
+        return self._request("GET", self._ep["balancers"]())
 
     def get_load_balancer(self, balancer_id: int):
         """Get load balancer."""
-        return self._request("GET", f"{self.api_url}/balancers/{balancer_id}")
+        return self._request("GET", self._ep["balancer"](balancer_id))
 
     def create_load_balancer(
         self,
@@ -1015,9 +1318,9 @@ class TimewebCloud(TimewebCloudBase):
             "is_use_proxy": proxy_protocol,
             "is_ssl": force_https,
             "is_keepalive": backend_keepalive,
-            **({"network": network} if network else {}),
+            **_compact_truthy(network=network),
         }
-        return self._request("POST", f"{self.api_url}/balancers", json=payload)
+        return self._request("POST", self._ep["balancers"](), json=payload)
 
     def update_load_balancer(
         self,
@@ -1038,32 +1341,28 @@ class TimewebCloud(TimewebCloudBase):
         backend_keepalive: Optional[bool] = None,
     ):
         """Update load balancer settings."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"preset_id": preset_id} if preset_id else {}),
-            **({"algo": algo} if algo else {}),
-            **({"proto": proto} if proto else {}),
-            **({"port": port} if port else {}),
-            **({"path": path} if path else {}),
-            **({"inter": inter} if inter else {}),
-            **({"timeout": timeout} if timeout else {}),
-            **({"fall": fall} if fall else {}),
-            **({"rise": rise} if rise else {}),
-            **({"is_sticky": sticky} if sticky is not None else {}),
-            **(
-                {"is_use_proxy": proxy_protocol}
-                if proxy_protocol is not None
-                else {}
-            ),
-            **({"is_ssl": force_https} if force_https is not None else {}),
-            **(
-                {"is_keepalive": backend_keepalive}
-                if backend_keepalive is not None
-                else {}
-            ),
-        }
+        payload = _compact_truthy(
+            name=name,
+            preset_id=preset_id,
+            algo=algo,
+            proto=proto,
+            port=port,
+            path=path,
+            inter=inter,
+            timeout=timeout,
+            fall=fall,
+            rise=rise,
+        )
+        payload.update(
+            _compact(
+                is_sticky=sticky,
+                is_use_proxy=proxy_protocol,
+                is_ssl=force_https,
+                is_keepalive=backend_keepalive,
+            )
+        )
         return self._request(
-            "PATCH", f"{self.api_url}/balancers/{balancer_id}", json=payload
+            "PATCH", self._ep["balancer"](balancer_id), json=payload
         )
 
     def delete_load_balancer(
@@ -1073,27 +1372,23 @@ class TimewebCloud(TimewebCloudBase):
         code: Optional[int] = None,
     ):
         """Delete load balancer."""
-        params = {
-            **({"hash": delete_hash} if delete_hash else {}),
-            **({"code": code} if code else {}),
-        }
+        params = _compact_truthy(hash=delete_hash)
+        params.update(_compact(code=code))
         return self._request(
             "DELETE",
-            f"{self.api_url}/balancers/{balancer_id}",
+            self._ep["balancer"](balancer_id),
             params=params,
         )
 
     def get_load_balancer_ips(self, balancer_id: int):
         """Get load balancer IP addresses."""
-        return self._request(
-            "GET", f"{self.api_url}/balancers/{balancer_id}/ips"
-        )
+        return self._request("GET", self._ep["balancer_ips"](balancer_id))
 
     def add_ips_to_load_balancer(self, balancer_id: int, ips: List[str]):
         """Attach IP addresses to load balancer."""
         return self._request(
             "POST",
-            f"{self.api_url}/balancers/{balancer_id}/ips",
+            self._ep["balancer_ips"](balancer_id),
             json={"ips": ips},
         )
 
@@ -1101,15 +1396,13 @@ class TimewebCloud(TimewebCloudBase):
         """Detach IP addresses from load balancer."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/balancers/{balancer_id}/ips",
+            self._ep["balancer_ips"](balancer_id),
             json={"ips": ips},
         )
 
     def get_load_balancer_rules(self, balancer_id: int):
         """Get load balancer IP addresses."""
-        return self._request(
-            "GET", f"{self.api_url}/balancers/{balancer_id}/rules"
-        )
+        return self._request("GET", self._ep["balancer_rules"](balancer_id))
 
     def create_load_balancer_rule(
         self,
@@ -1128,7 +1421,7 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "POST",
-            f"{self.api_url}/balancers/{balancer_id}/rules",
+            self._ep["balancer_rules"](balancer_id),
             json=payload,
         )
 
@@ -1142,15 +1435,15 @@ class TimewebCloud(TimewebCloudBase):
         server_port: Optional[int] = None,
     ):
         """Create load balancer rule."""
-        payload = {
-            **({"balancer_proto": balancer_proto} if balancer_proto else {}),
-            **({"balancer_port": balancer_port} if balancer_port else {}),
-            **({"server_proto": server_proto} if server_proto else {}),
-            **({"server_port": server_port} if server_port else {}),
-        }
+        payload = _compact_truthy(
+            balancer_proto=balancer_proto,
+            balancer_port=balancer_port,
+            server_proto=server_proto,
+            server_port=server_port,
+        )
         return self._request(
             "PATCH",
-            f"{self.api_url}/balancers/{balancer_id}/rules/{rule_id}",
+            self._ep["balancer_rule"](balancer_id, rule_id),
             json=payload,
         )
 
@@ -1158,12 +1451,14 @@ class TimewebCloud(TimewebCloudBase):
         """Delete load balancer rule."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/balancers/{balancer_id}/rules/{rule_id}",
+            self._ep["balancer_rule"](balancer_id, rule_id),
         )
 
     def get_load_balancer_presets(self):
         """Get list of LB presets."""
-        return self._request("GET", f"{self.api_url}/presets/balancers")
+        return self._cached_get(
+            self._ep["balancer_presets"](), ttl=self.CATALOG_TTL
+        )
 
     # -----------------------------------------------------------------------
     # Kubernetes
@@ -1173,7 +1468,7 @@ class TimewebCloud(TimewebCloudBase):
         params = {"limit": limit, "offset": offset}
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters",
+            self._ep["k8s_clusters"](),
             params=params,
         )
 
@@ -1181,7 +1476,7 @@ class TimewebCloud(TimewebCloudBase):
         """Get Kubernetes cluster info."""
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}",
+            self._ep["k8s_cluster"](cluster_id),
         )
 
     def create_k8s_cluster(
@@ -1211,15 +1506,11 @@ class TimewebCloud(TimewebCloudBase):
             "network_driver": network_driver,
             "ingress": ingress,
             "preset_id": preset_id,
-            **(
-                {"worker_groups": worker_groups}
-                if worker_groups is not None
-                else {}
-            ),
+            **_compact(worker_groups=worker_groups),
         }
         return self._request(
             "POST",
-            f"{self.api_url}/k8s/clusters",
+            self._ep["k8s_clusters"](),
             json=payload,
         )
 
@@ -1230,13 +1521,11 @@ class TimewebCloud(TimewebCloudBase):
         code: Optional[int] = None,
     ):
         """Delete Kubernetes cluster."""
-        params = {
-            **({"hash": delete_hash} if delete_hash else {}),
-            **({"code": code} if code else {}),
-        }
+        params = _compact_truthy(hash=delete_hash)
+        params.update(_compact(code=code))
         return self._request(
             "DELETE",
-            f"{self.api_url}/k8s/clusters/{cluster_id}",
+            self._ep["k8s_cluster"](cluster_id),
             params=params,
         )
 
@@ -1247,7 +1536,7 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "PATCH",
-            f"{self.api_url}/k8s/clusters/{cluster_id}",
+            self._ep["k8s_cluster"](cluster_id),
             json=payload,
         )
 
@@ -1255,30 +1544,33 @@ class TimewebCloud(TimewebCloudBase):
         """Return cluster resources status."""
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/resources",
+            self._ep["k8s_resources"](cluster_id),
         )
 
-    def get_k8s_cluster_kubeconfig(self, cluster_id: int):
+    def get_k8s_cluster_kubeconfig(self, cluster_id: int, stream=False):
         """Download kubeconfig for kubecctl util. API respond
-        with application/yaml data.
+        with application/yaml data. Pass `stream=True` to read it by
+        chunks with `response.iter_content()` instead of loading whole
+        file into memory.
         """
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/kubeconfig",
+            self._ep["k8s_kubeconfig"](cluster_id),
+            stream=stream,
         )
 
     def get_k8s_node_groups(self, cluster_id: int):
         """Get list of worker nodes groups."""
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups",
+            self._ep["k8s_groups"](cluster_id),
         )
 
     def get_k8s_node_group(self, cluster_id: int, group_id: int):
         """Get nodes group info."""
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups/{group_id}",
+            self._ep["k8s_group"](cluster_id, group_id),
         )
 
     def create_k8s_node_group(
@@ -1296,7 +1588,7 @@ class TimewebCloud(TimewebCloudBase):
         }
         return self._request(
             "POST",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups",
+            self._ep["k8s_groups"](cluster_id),
             json=payload,
         )
 
@@ -1304,7 +1596,7 @@ class TimewebCloud(TimewebCloudBase):
         """Delete cluster nodes group."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups/{group_id}",
+            self._ep["k8s_group"](cluster_id, group_id),
         )
 
     def get_k8s_nodes_by_group(
@@ -1314,7 +1606,7 @@ class TimewebCloud(TimewebCloudBase):
         params = {"limit": limit, "offset": offset}
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups/{group_id}/nodes",
+            self._ep["k8s_group_nodes"](cluster_id, group_id),
             params=params,
         )
 
@@ -1324,7 +1616,7 @@ class TimewebCloud(TimewebCloudBase):
         """Add new nodes to nodes group."""
         return self._request(
             "POST",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups/{group_id}/nodes",
+            self._ep["k8s_group_nodes"](cluster_id, group_id),
             json={"count": count},
         )
 
@@ -1334,7 +1626,7 @@ class TimewebCloud(TimewebCloudBase):
         """Delete nodes from nodes group."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/groups/{group_id}/nodes",
+            self._ep["k8s_group_nodes"](cluster_id, group_id),
             json={"count": count},
         )
 
@@ -1342,27 +1634,33 @@ class TimewebCloud(TimewebCloudBase):
         """Get list of Kubernetes nodes."""
         return self._request(
             "GET",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/nodes",
+            self._ep["k8s_nodes"](cluster_id),
         )
 
     def delete_k8s_node(self, cluster_id: int, node_id: int):
         """Delete node from cluster."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/k8s/clusters/{cluster_id}/nodes/{node_id}",
+            self._ep["k8s_node"](cluster_id, node_id),
         )
 
     def get_k8s_versions(self):
         """List available Kubernetes versions."""
-        return self._request("GET", f"{self.api_url}/k8s/k8s_versions")
+        return self._cached_get(
+            self._ep["k8s_versions"](), ttl=self.CATALOG_TTL
+        )
 
     def get_k8s_network_drivers(self):
         """List available Kubernetes network drivers."""
-        return self._request("GET", f"{self.api_url}/k8s/network_drivers")
+        return self._cached_get(
+            self._ep["k8s_network_drivers"](), ttl=self.CATALOG_TTL
+        )
 
     def get_k8s_presets(self):
         """List available Kubernetes nodes presets."""
-        return self._request("GET", f"{self.api_url}/presets/k8s")
+        return self._cached_get(
+            self._ep["k8s_presets"](), ttl=self.CATALOG_TTL
+        )
 
     # -----------------------------------------------------------------------
     # Domains
@@ -1370,11 +1668,11 @@ class TimewebCloud(TimewebCloudBase):
     def get_domains(self, limit: int = 100, offset: int = 0):
         """Get domains list."""
         params = {"limit": limit, "offset": offset}
-        return self._request("GET", f"{self.api_url}/domains", params=params)
+        return self._request("GET", self._ep["domains"](), params=params)
 
     def get_domain(self, fqdn: str):
         """Get domain."""
-        return self._request("GET", f"{self.api_url}/domains/{fqdn}")
+        return self._request("GET", self._ep["domain"](fqdn))
 
     def domain_turn_on_autoprolong(
         self,
@@ -1385,17 +1683,15 @@ class TimewebCloud(TimewebCloudBase):
         payload = {
             "is_autoprolong_enabled": is_autoprolong_enabled,
         }
-        return self._request(
-            "PATCH", f"{self.api_url}/domains/{fqdn}", json=payload
-        )
+        return self._request("PATCH", self._ep["domain"](fqdn), json=payload)
 
     def delete_domain(self, fqdn: str):
         """Delete Domain."""
-        return self._request("DELETE", f"{self.api_url}/domains/{fqdn}")
+        return self._request("DELETE", self._ep["domain"](fqdn))
 
     def add_domain(self, fqdn: str):
         """Add Domain."""
-        return self._request("POST", f"{self.api_url}/add-domain/{fqdn}")
+        return self._request("POST", self._ep["add_domain"](fqdn))
 
     def get_domain_dns_records(
         self, fqdn: str, limit: int = 100, offset: int = 0
@@ -1403,7 +1699,7 @@ class TimewebCloud(TimewebCloudBase):
         """Get domain DNS records."""
         params = {"limit": limit, "offset": offset}
         return self._request(
-            "GET", f"{self.api_url}/domains/{fqdn}/dns-records", params=params
+            "GET", self._ep["domain_records"](fqdn), params=params
         )
 
     def add_domain_dns_record(
@@ -1420,14 +1716,13 @@ class TimewebCloud(TimewebCloudBase):
         payload = {
             "type": dns_record_type,
             "value": value,
-            **({"subdomain": subdomain} if subdomain else {}),
-            **({"priority": priority} if priority else {}),
+            **_compact_truthy(subdomain=subdomain, priority=priority),
         }
         if null_subdomain:
             payload["subdomain"] = None
         return self._request(
             "POST",
-            f"{self.api_url}/domains/{fqdn}/dns-records",
+            self._ep["domain_records"](fqdn),
             json=payload,
         )
 
@@ -1444,12 +1739,11 @@ class TimewebCloud(TimewebCloudBase):
         payload = {
             "type": dns_record_type,
             "value": value,
-            **({"subdomain": subdomain} if subdomain else {}),
-            **({"priority": priority} if priority else {}),
+            **_compact_truthy(subdomain=subdomain, priority=priority),
         }
         return self._request(
             "PATCH",
-            f"{self.api_url}/domains/{fqdn}/dns-records/{record_id}",
+            self._ep["domain_record"](fqdn, record_id),
             json=payload,
         )
 
@@ -1457,21 +1751,21 @@ class TimewebCloud(TimewebCloudBase):
         """Delete DNS record on domain."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/domains/{fqdn}/dns-records/{record_id}",
+            self._ep["domain_record"](fqdn, record_id),
         )
 
     def add_subdomain(self, fqdn: str, subdomain_fqdn: str):
         """Add subdomian tp domain."""
         return self._request(
             "POST",
-            f"{self.api_url}/domains/{fqdn}/subdomains/{subdomain_fqdn}",
+            self._ep["subdomain"](fqdn, subdomain_fqdn),
         )
 
     def delete_subdomain(self, fqdn: str, subdomain_fqdn: str):
         """Add subdomian tp domain."""
         return self._request(
             "DELETE",
-            f"{self.api_url}/domains/{fqdn}/subdomains/{subdomain_fqdn}",
+            self._ep["subdomain"](fqdn, subdomain_fqdn),
         )
 
     # -----------------------------------------------------------------------
@@ -1481,11 +1775,11 @@ class TimewebCloud(TimewebCloudBase):
 
     def get_vpcs(self):
         """Return list of private networks."""
-        return self._request("GET", f"{self.api_url_v2}/vpcs")
+        return self._request("GET", self._ep["vpcs"]())
 
     def get_vpc(self, vpc_id: str):
         """Return network information."""
-        return self._request("GET", f"{self.api_url_v2}/vpcs/{vpc_id}")
+        return self._request("GET", self._ep["vpc"](vpc_id))
 
     def create_vpc(
         self,
@@ -1500,14 +1794,12 @@ class TimewebCloud(TimewebCloudBase):
             "name": name,
             "subnet_v4": subnet,
             "location": location,
-            **(
-                {"availability_zone": str(availability_zone)}
-                if availability_zone
-                else {}
+            **_compact_truthy(
+                availability_zone=availability_zone,
+                description=description,
             ),
-            **({"description": description} if description else {}),
         }
-        return self._request("POST", f"{self.api_url_v2}/vpcs", json=payload)
+        return self._request("POST", self._ep["vpcs"](), json=payload)
 
     def update_vpc(
         self,
@@ -1516,29 +1808,24 @@ class TimewebCloud(TimewebCloudBase):
         description: Optional[str] = None,
     ):
         """Update network information."""
-        payload = {
-            **({"name": name} if name else {}),
-            **({"description": description} if description else {}),
-        }
+        payload = _compact_truthy(name=name, description=description)
         return self._request(
             "PATCH",
-            f"{self.api_url_v2}/vpcs/{vpc_id}",
+            self._ep["vpc"](vpc_id),
             json=payload,
         )
 
     def delete_vpc(self, vpc_id: str):
         """Delete network."""
-        return self._request("DELETE", f"{self.api_url_v1}/vpcs/{vpc_id}")
+        return self._request("DELETE", self._ep["vpc_v1"](vpc_id))
 
     def get_services_in_vpc(self, vpc_id: str):
         """Return network information."""
-        return self._request(
-            "GET", f"{self.api_url_v2}/vpcs/{vpc_id}/services"
-        )
+        return self._request("GET", self._ep["vpc_services"](vpc_id))
 
     def get_vpc_ports(self, vpc_id: str):
         """Return network information."""
-        return self._request("GET", f"{self.api_url_v1}/vpcs/{vpc_id}/ports")
+        return self._request("GET", self._ep["vpc_ports"](vpc_id))
 
     # -----------------------------------------------------------------------
     # Firewall
@@ -1547,7 +1834,7 @@ class TimewebCloud(TimewebCloudBase):
         """Get list of firewall groups."""
         params = {"limit": limit, "offset": offset}
         return self._request(
-            "GET", f"{self.api_url}/firewall/groups", params=params
+            "GET", self._ep["firewall_groups"](), params=params
         )
 
     def create_firewall_group(
@@ -1558,24 +1845,20 @@ class TimewebCloud(TimewebCloudBase):
     ):
         payload = {
             "name": name,
-            **({"description": description} if description else {}),
+            **_compact_truthy(description=description),
         }
         return self._request(
             "POST",
-            f"{self.api_url}/firewall/groups",
+            self._ep["firewall_groups"](),
             json=payload,
             params={"policy": policy},
         )
 
     def get_firewall_group(self, group_id: UUID):
-        return self._request(
-            "GET", f"{self.api_url}/firewall/groups/{group_id}"
-        )
+        return self._request("GET", self._ep["firewall_group"](group_id))
 
     def delete_firewall_group(self, group_id: UUID):
-        return self._request(
-            "DELETE", f"{self.api_url}/firewall/groups/{group_id}"
-        )
+        return self._request("DELETE", self._ep["firewall_group"](group_id))
 
     def update_firewall_group(
         self,
@@ -1585,10 +1868,10 @@ class TimewebCloud(TimewebCloudBase):
     ):
         payload = {
             "name": name,
-            **({"description": description} if description else {}),
+            **_compact_truthy(description=description),
         }
         return self._request(
-            "PATCH", f"{self.api_url}/firewall/groups/{group_id}", json=payload
+            "PATCH", self._ep["firewall_group"](group_id), json=payload
         )
 
     def get_firewall_group_resources(
@@ -1597,7 +1880,7 @@ class TimewebCloud(TimewebCloudBase):
         params = {"limit": limit, "offset": offset}
         return self._request(
             "GET",
-            f"{self.api_url}/firewall/groups/{group_id}/resources",
+            self._ep["firewall_group_resources"](group_id),
             params=params,
         )
 
@@ -1607,11 +1890,11 @@ class TimewebCloud(TimewebCloudBase):
         resource_id: Union[str, int],
         resource_type: str,
     ):
-        if resource_type not in ["server", "dbaas", "balancer"]:
+        if resource_type not in FIREWALL_RESOURCE_TYPES:
             raise ValueError("Invalid resource type")
         return self._request(
             "POST",
-            f"{self.api_url}/firewall/groups/{group_id}/resources/{resource_id}",
+            self._ep["firewall_group_resource"](group_id, resource_id),
             params={"resource_type": resource_type},
         )
 
@@ -1621,11 +1904,11 @@ class TimewebCloud(TimewebCloudBase):
         resource_id: Union[str, int],
         resource_type: str,
     ):
-        if resource_type not in ["server", "dbaas", "balancer"]:
+        if resource_type not in FIREWALL_RESOURCE_TYPES:
             raise ValueError("Invalid resource type")
         return self._request(
             "DELETE",
-            f"{self.api_url}/firewall/groups/{group_id}/resources/{resource_id}",
+            self._ep["firewall_group_resource"](group_id, resource_id),
             params={"resource_type": resource_type},
         )
 
@@ -1636,7 +1919,7 @@ class TimewebCloud(TimewebCloudBase):
         params = {"limit": limit, "offset": offset}
         return self._request(
             "GET",
-            f"{self.api_url}/firewall/groups/{group_id}/rules",
+            self._ep["firewall_rules"](group_id),
             params=params,
         )
 
@@ -1650,27 +1933,28 @@ class TimewebCloud(TimewebCloudBase):
         description: Optional[str] = None,
     ):
         payload = {
-            **({"description": description} if description else {}),
-            **({} if protocol == FirewallProto.ICMP.value else {"port": port}),
+            **_compact_truthy(description=description),
             "direction": direction,
             "protocol": protocol,
             "cidr": cidr,
         }
+        if protocol != FirewallProto.ICMP.value:
+            payload["port"] = port
         return self._request(
             "POST",
-            f"{self.api_url}/firewall/groups/{group_id}/rules",
+            self._ep["firewall_rules"](group_id),
             json=payload,
         )
 
     def get_firewall_rule(self, group_id: UUID, rule_id: UUID):
         return self._request(
-            "GET", f"{self.api_url}/firewall/groups/{group_id}/rules/{rule_id}"
+            "GET", self._ep["firewall_rule"](group_id, rule_id)
         )
 
     def delete_firewall_rule(self, group_id: UUID, rule_id: UUID):
         return self._request(
             "DELETE",
-            f"{self.api_url}/firewall/groups/{group_id}/rules/{rule_id}",
+            self._ep["firewall_rule"](group_id, rule_id),
         )
 
     def update_firewall_rule(
@@ -1684,15 +1968,16 @@ class TimewebCloud(TimewebCloudBase):
         description: Optional[str] = None,
     ):
         payload = {
-            **({"description": description} if description else {}),
-            **({} if protocol == FirewallProto.ICMP.value else {"port": port}),
+            **_compact_truthy(description=description),
             "direction": direction,
             "protocol": protocol,
             "cidr": cidr,
         }
+        if protocol != FirewallProto.ICMP.value:
+            payload["port"] = port
         return self._request(
             "PATCH",
-            f"{self.api_url}/firewall/groups/{group_id}/rules/{rule_id}",
+            self._ep["firewall_rule"](group_id, rule_id),
             json=payload,
         )
 
@@ -1704,11 +1989,11 @@ class TimewebCloud(TimewebCloudBase):
         offset: int = 0,
     ):
         params = {"limit": limit, "offset": offset}
-        if resource_type not in ["server", "dbaas", "balancer"]:
+        if resource_type not in FIREWALL_RESOURCE_TYPES:
             raise ValueError("Invalid resource type")
         return self._request(
             "GET",
-            f"{self.api_url}/firewall/service/{resource_type}/{resource_id}",
+            self._ep["firewall_service"](resource_type, resource_id),
             params=params,
         )
 
@@ -1716,12 +2001,10 @@ class TimewebCloud(TimewebCloudBase):
     # Floating IPs
 
     def get_floating_ips(self):
-        return self._request("GET", f"{self.api_url_v1}/floating-ips")
+        return self._request("GET", self._ep["floating_ips"]())
 
     def get_floating_ip(self, floating_ip_id: str):
-        return self._request(
-            "GET", f"{self.api_url_v1}/floating-ips/{floating_ip_id}"
-        )
+        return self._request("GET", self._ep["floating_ip"](floating_ip_id))
 
     def create_floating_ip(
         self,
@@ -1730,11 +2013,9 @@ class TimewebCloud(TimewebCloudBase):
     ):
         payload = {
             "is_ddos_guard": ddos_protection,
-            "availability_zone": str(availability_zone),
+            "availability_zone": availability_zone,
         }
-        return self._request(
-            "POST", f"{self.api_url_v1}/floating-ips", json=payload
-        )
+        return self._request("POST", self._ep["floating_ips"](), json=payload)
 
     def update_floating_ip(
         self,
@@ -1742,21 +2023,15 @@ class TimewebCloud(TimewebCloudBase):
         comment: Optional[str] = None,
         ptr: Optional[str] = None,
     ):
-        payload = {}
-        if comment:
-            payload["comment"] = comment
-        if ptr:
-            payload["ptr"] = ptr
+        payload = _compact_truthy(comment=comment, ptr=ptr)
         return self._request(
             "PATCH",
-            f"{self.api_url_v1}/floating-ips/{floating_ip_id}",
+            self._ep["floating_ip"](floating_ip_id),
             json=payload,
         )
 
     def delete_floating_ip(self, floating_ip_id: str):
-        return self._request(
-            "DELETE", f"{self.api_url_v1}/floating-ips/{floating_ip_id}"
-        )
+        return self._request("DELETE", self._ep["floating_ip"](floating_ip_id))
 
     def attach_floating_ip(
         self,
@@ -1767,11 +2042,11 @@ class TimewebCloud(TimewebCloudBase):
         payload = {"resource_type": resource_type, "resource_id": resource_id}
         return self._request(
             "POST",
-            f"{self.api_url_v1}/floating-ips/{floating_ip_id}/bind",
+            self._ep["floating_ip_bind"](floating_ip_id),
             json=payload,
         )
 
     def detach_floating_ip(self, floating_ip_id: str):
         return self._request(
-            "POST", f"{self.api_url_v1}/floating-ips/{floating_ip_id}/unbind"
+            "POST", self._ep["floating_ip_unbind"](floating_ip_id)
         )
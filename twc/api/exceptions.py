@@ -9,6 +9,8 @@ from requests import HTTPError, PreparedRequest, Response
 class ErrResponse:
     """API error response schema."""
 
+    __slots__ = ("status_code", "error_code", "message", "response_id")
+
     def __init__(
         self,
         status_code: int = None,
@@ -16,20 +16,7 @@ class ServiceRegion(str, Enum):
 
     @classmethod
     def get_zones(cls, region: str) -> List[str]:
-        # pylint: disable=too-many-return-statements
-        if region == cls.RU_1:
-            return ["spb-1", "spb-2", "spb-3", "spb-4"]
-        if region == cls.RU_2:
-            return ["nsk-1"]
-        if region == cls.RU_3:
-            return ["msk-1"]
-        if region == cls.KZ_1:
-            return ["ala-1"]
-        if region == cls.PL_1:
-            return ["gdn-1"]
-        if region == cls.NL_1:
-            return ["ams-1"]
-        return []
+        return list(REGION_ZONES.get(region, ()))
 
 
 class ServiceAvailabilityZone(str, Enum):
@@ -47,20 +34,24 @@ class ServiceAvailabilityZone(str, Enum):
 
     @classmethod
     def get_region(cls, zone: str) -> Optional[str]:
-        # pylint: disable=too-many-return-statements
-        if zone in [cls.SPB_1, cls.SPB_2, cls.SPB_3, cls.SPB_4]:
-            return ServiceRegion.RU_1
-        if zone == cls.NSK_1:
-            return ServiceRegion.RU_2
-        if zone == cls.MSK_1:
-            return ServiceRegion.RU_3
-        if zone == cls.ALA_1:
-            return ServiceRegion.KZ_1
-        if zone == cls.GDN_1:
-            return ServiceRegion.PL_1
-        if zone == cls.AMS_1:
-            return ServiceRegion.NL_1
-        return None
+        return ZONE_REGION.get(zone)
+
+
+# Availability zones by region. Keys are plain values: str-based enum
+# members hash and compare as their values, so both can be looked up.
+REGION_ZONES = {
+    "ru-1": ("spb-1", "spb-2", "spb-3", "spb-4"),
+    "ru-2": ("nsk-1",),
+    "ru-3": ("msk-1",),
+    "kz-1": ("ala-1",),
+    "pl-1": ("gdn-1",),
+    "nl-1": ("ams-1",),
+}
+ZONE_REGION = {
+    zone: ServiceRegion(region)
+    for region, zones in REGION_ZONES.items()
+    for zone in zones
+}
 
 
 class ServerAction(str, Enum):
@@ -94,7 +85,7 @@ class ServerBootMode(str, Enum):
     DEFAULT = "default"
     SINGLE = "single"
     # In API is named "recovery_disk" there is a shortcut for CLI.
-    # See TimewebCloud.set_server_boot_mode()
+    # See BOOT_MODE_ALIASES in twc.api.client
     RECOVERY = "recovery"
 
 
@@ -2,14 +2,48 @@
 
 import os
 import sys
-import textwrap
 from pathlib import Path
 from logging import debug, warning
+from typing import TYPE_CHECKING
 
-from .api import TimewebCloud
 from .api import exceptions as exc
 from .commands.common import load_config
 
+if TYPE_CHECKING:
+    from .api import TimewebCloud
+
+
+UNAUTHORIZED_ERROR = (
+    "Error: {err}\nPlease check your API access token. Try run 'twc config'"
+)
+
+MALFORMED_RESPONSE_ERROR = (
+    "Error: API returned malformed response: {err}\n"
+    "Try run command with '--verbose' option for details."
+)
+
+UNEXPECTED_RESPONSE_ERROR = (
+    "Error: API returned unexpected response: {err}\n"
+    "Try run command with '--verbose' option for details."
+)
+
+API_ERROR = (
+    "Error ocurred.\n"
+    "Status code: {err.status_code}\n"
+    "Error code: {err.error_code}\n"
+    "Message: {err.message}\n"
+    "Response ID: {err.response_id}"
+)
+
+
+# Error message templates by exception class, subclasses use template of
+# their nearest mapped base. Other API errors are reported with API_ERROR.
+ERROR_TEMPLATES = {
+    exc.UnauthorizedError: UNAUTHORIZED_ERROR,
+    exc.MalformedResponseError: MALFORMED_RESPONSE_ERROR,
+    exc.UnexpectedResponseError: UNEXPECTED_RESPONSE_ERROR,
+}
+
 
 def request_handler(func):
     """Error handler decorator for requests. Wrap API exceptions
@@ -21,65 +55,40 @@ def request_handler(func):
             return func(self, *args, **kwargs)
         except exc.NetworkError as err:
             sys.exit(f"Error: {err}")
-        except exc.UnauthorizedError as err:
-            sys.exit(
-                textwrap.dedent(
-                    f"""
-                    Error: {err}
-                    Please check your API access token. Try run 'twc config'
-                    """
-                ).strip()
-            )
-        except exc.MalformedResponseError as err:
-            sys.exit(
-                textwrap.dedent(
-                    f"""
-                    Error: API returned malformed response: {err}
-                    Try run command with '--verbose' option for details.
-                    """
-                ).strip()
-            )
-        except exc.UnexpectedResponseError as err:
-            sys.exit(
-                textwrap.dedent(
-                    f"""
-                    Error: API returned unexpected response: {err}
-                    Try run command with '--verbose' option for details.
-                    """
-                ).strip()
-            )
         except exc.TimewebCloudException as err:
-            sys.exit(
-                textwrap.dedent(
-                    f"""
-                    Error ocurred.
-                    Status code: {err.status_code}
-                    Error code: {err.error_code}
-                    Message: {err.message}
-                    Response ID: {err.response_id}
-                    """
-                ).strip()
+            template = next(
+                (
+                    ERROR_TEMPLATES[cls]
+                    for cls in type(err).__mro__
+                    if cls in ERROR_TEMPLATES
+                ),
+                API_ERROR,
             )
+            sys.exit(template.format(err=err))
 
     return wrapper
 
 
-def create_client(config: Path, profile: str, **kwargs) -> TimewebCloud:
+def create_client(config: Path, profile: str, **kwargs) -> "TimewebCloud":
     """API client wrapper. Read configuration file and return
     `TimewebCloud` object with decorator.
     """
-    token = os.getenv("TWC_TOKEN")
-    log_settings = os.getenv("TWC_LOG")
-    api_endpoint = os.getenv("TWC_ENDPOINT")
+    # pylint: disable=import-outside-toplevel
+    from .api import TimewebCloud
+
+    env = os.environ
+    token = env.get("TWC_TOKEN")
+    log_settings = env.get("TWC_LOG")
+    api_endpoint = env.get("TWC_ENDPOINT")
 
     if api_endpoint:
         warning("Using API URL from environment: %s", api_endpoint)
         kwargs["api_base_url"] = api_endpoint
 
     if log_settings:
-        for param in log_settings.split(","):
-            if param.lower() == "debug":
-                pass  # FUTURE: set logging.DEBUG
+        log_params = frozenset(log_settings.lower().split(","))
+        if "debug" in log_params:
+            pass  # FUTURE: set logging.DEBUG
 
     if token:
         debug("Config: use API token from environment")
@@ -0,0 +1,104 @@
+"""CLI for Timeweb Cloud services."""
+
+from typing import Optional
+from pathlib import Path
+
+import typer
+
+from .typerx import TyperAlias, LazyGroup
+from .commands.common import version_callback, version_option, verbose_option
+
+
+class Commands(LazyGroup):
+    """Root level commands. Command modules are imported on demand."""
+
+    lazy_subcommands = {
+        "config": ("twc.commands.config", "config"),
+        "account": ("twc.commands.account", "account"),
+        "server": ("twc.commands.server", "server"),
+        "ssh-key": ("twc.commands.ssh_key", "ssh_key"),
+        "image": ("twc.commands.image", "image"),
+        "project": ("twc.commands.project", "project"),
+        "database": ("twc.commands.database", "database"),
+        "storage": ("twc.commands.storage", "storage"),
+        "balancer": ("twc.commands.balancer", "balancer"),
+        "cluster": ("twc.commands.kubernetes", "cluster"),
+        "domain": ("twc.commands.domain", "domain"),
+        "vpc": ("twc.commands.vpc", "vpc"),
+        "firewall": ("twc.commands.firewall", "firewall"),
+        "ip": ("twc.commands.floating_ip", "floating_ip"),
+        "whoami": ("twc.commands.account", "whoami"),
+    }
+    lazy_aliases = {
+        "servers": "server",
+        "s": "server",
+        "ssh-keys": "ssh-key",
+        "k": "ssh-key",
+        "images": "image",
+        "i": "image",
+        "projects": "project",
+        "p": "project",
+        "databases": "database",
+        "db": "database",
+        "storages": "storage",
+        "s3": "storage",
+        "balancers": "balancer",
+        "lb": "balancer",
+        "clusters": "cluster",
+        "kubernetes": "cluster",
+        "k8s": "cluster",
+        "domains": "domain",
+        "d": "domain",
+        "vpcs": "vpc",
+        "network": "vpc",
+        "networks": "vpc",
+        "fw": "firewall",
+        "ips": "ip",
+    }
+
+
+cli = TyperAlias(
+    cls=Commands,
+    help=__doc__,
+    no_args_is_help=True,
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+
+
+@cli.command("version")
+def version_command():
+    """Show version and exit."""
+    version_callback(True)
+
+
+@cli.callback()
+def root(
+    version: Optional[bool] = version_option,
+    verbose: Optional[bool] = verbose_option,
+    # pylint: disable=redefined-outer-name
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        envvar="TWC_CONFIG_FILE",
+        show_envvar=False,
+        show_default=False,
+        exists=True,
+        dir_okay=False,
+        help="Use config.",
+        rich_help_panel="Global options",
+    ),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        "-p",
+        metavar="NAME",
+        envvar="TWC_PROFILE",
+        show_envvar=False,
+        show_default=False,
+        help="Use profile.",
+        rich_help_panel="Global options",
+    ),
+):
+    # pylint: disable=unused-argument
+    """Callback for root level command options."""
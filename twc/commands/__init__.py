@@ -1,16 +1 @@
 """Commands."""
-
-from .account import account, whoami
-from .config import config
-from .server import server
-from .ssh_key import ssh_key
-from .image import image
-from .project import project
-from .database import database
-from .storage import storage
-from .balancer import balancer
-from .kubernetes import cluster
-from .domain import domain
-from .vpc import vpc
-from .firewall import firewall
-from .floating_ip import floating_ip
@@ -1,15 +1,12 @@
 """Manage Timeweb Cloud account."""
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 from textwrap import dedent
 
 import typer
-from requests import Response
 
-from twc import fmt
 from twc.typerx import TyperAlias
-from twc.apiwrap import create_client
 from .common import (
     verbose_option,
     config_option,
@@ -17,6 +14,13 @@ from .common import (
     output_format_option,
 )
 
+if TYPE_CHECKING:
+    from requests import Response
+
+# API client and output formatting are imported in command bodies, so
+# 'twc account --help' and shell completion don't import them.
+# pylint: disable=import-outside-toplevel
+
 
 whoami = TyperAlias(help="Display current login.", no_args_is_help=False)
 
@@ -34,6 +38,9 @@ def whoami_callback(
     output_format: Optional[str] = output_format_option,
 ):
     """Display current login."""
+    from twc import fmt
+    from twc.apiwrap import create_client
+
     client = create_client(config, profile)
     response = client.get_account_status()
     login = response.json()["status"]["login"]
@@ -57,7 +64,7 @@ account.add_typer(account_access, name="access")
 # ------------------------------------------------------------- #
 
 
-def print_account_status(response: Response):
+def print_account_status(response: "Response"):
     """Print table with account info."""
     status = response.json()["status"]
     output = dedent(
@@ -82,6 +89,9 @@ def account_status(
     output_format: Optional[str] = output_format_option,
 ):
     """Display account status."""
+    from twc import fmt
+    from twc.apiwrap import create_client
+
     client = create_client(config, profile)
     response = client.get_account_status()
     fmt.printer(
@@ -94,7 +104,7 @@ def account_status(
 # ------------------------------------------------------------- #
 
 
-def print_account_finances(response: Response):
+def print_account_finances(response: "Response"):
     """Print table with finances info."""
     finances = response.json()["finances"]
     output = dedent(
@@ -123,6 +133,9 @@ def account_finances(
     output_format: Optional[str] = output_format_option,
 ):
     """Get finances."""
+    from twc import fmt
+    from twc.apiwrap import create_client
+
     client = create_client(config, profile)
     response = client.get_account_finances()
     fmt.printer(
@@ -136,7 +149,7 @@ def account_finances(
 
 
 def print_restrictions_status(
-    response: Response, by_ip: bool, by_country: bool
+    response: "Response", by_ip: bool, by_country: bool
 ):
     """Print restrictions info."""
     restrictions = response.json()
@@ -177,6 +190,9 @@ def restrictions_status(
     ),
 ):
     """View access restrictions status."""
+    from twc import fmt
+    from twc.apiwrap import create_client
+
     client = create_client(config, profile)
     response = client.get_account_restrictions()
     fmt.printer(
@@ -1,13 +1,15 @@
 """Common functions for commands."""
 
+import os
 import re
 import sys
+from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Any
 from pathlib import Path, PurePath
 from logging import basicConfig, debug, DEBUG
 
-import toml
 import typer
 from typer.core import TyperOption
 from click import UsageError
@@ -15,6 +17,15 @@ from click import UsageError
 from twc.__version__ import __version__
 from twc.api.types import ServiceRegion, ServiceAvailabilityZone
 
+# Fast TOML parser from standard library (Python 3.11+). `toml` is still
+# used to write config.
+try:
+    import tomllib
+    from tomllib import TOMLDecodeError
+except ImportError:
+    tomllib = None
+    from toml import TomlDecodeError as TOMLDecodeError
+
 
 class OutputFormat(str, Enum):
     """Data output formats. See `output_format_option`."""
@@ -53,32 +64,57 @@ def get_root_ctx(ctx: typer.Context) -> typer.Context:
     return context
 
 
-def default_config_file() -> Path:
-    """Return default configuration file path."""
+@lru_cache(maxsize=None)
+def _find_config_file(home: Path) -> Path:
+    """Return path to existing config file in `home` or path to default
+    one. Cached, it is called from option callbacks of every command.
+    """
     filenames = [
         ".twcrc",
         ".twcrc.toml",
     ]
     for filename in filenames:
-        filepath = Path(PurePath(Path.home()).joinpath(filename))
+        filepath = Path(PurePath(home).joinpath(filename))
         if filepath.exists():
             debug(f"Configuration file found: {filepath}")
             return filepath
-    return Path(PurePath(Path.home()).joinpath(filenames[0]))
+    return Path(PurePath(home).joinpath(filenames[0]))
+
+
+def default_config_file() -> Path:
+    """Return default configuration file path."""
+    return _find_config_file(Path.home())
+
+
+@lru_cache(maxsize=8)
+def _read_config(filepath: str, mtime_ns: int) -> dict:
+    """Parse TOML config file. Cached by path and modification time, so
+    edited file is parsed again.
+    """
+    # pylint: disable=unused-argument
+    if tomllib:
+        with open(filepath, "rb") as file:
+            return tomllib.load(file)
+    import toml  # pylint: disable=import-outside-toplevel
+
+    with open(filepath, "r", encoding="utf-8") as file:
+        return toml.load(file)
 
 
 def load_config(filepath: Optional[Path] = default_config_file()) -> dict:
-    """Load configuration from TOML config file."""
+    """Load configuration from TOML config file. File is parsed once per
+    process while it is not changed, caller gets its own copy.
+    """
     try:
-        with open(filepath, "r", encoding="utf-8") as file:
-            return toml.load(file)
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        return deepcopy(_read_config(str(filepath), mtime_ns))
     except FileNotFoundError:
         sys.exit(
             f"Configuration file {filepath} not found. Try run 'twc config'"
         )
     except OSError as error:
         sys.exit(f"Error: Cannot read configuration file {filepath}: {error}")
-    except toml.TomlDecodeError as error:
+    except TOMLDecodeError as error:
         sys.exit(f"Error: Check your TOML syntax in file {filepath}: {error}")
 
 
@@ -89,6 +125,8 @@ def load_from_config_callback(
     custom enumerations such as OutputFormat and may others. Typer will return
     None instead of actual value returning by this function.
     """
+    if value is None and ctx.resilient_parsing:
+        return None  # shell completion, don't touch config file
     if value is None:
         try:
             config = config_callback(ctx.params["config"], ctx)
@@ -249,11 +249,13 @@ def cluster_kubeconfig(
 ):
     """Download KubeConfig."""
     client = create_client(config, profile)
-    file_content = client.get_k8s_cluster_kubeconfig(cluster_id).text
     if save:
-        with open(save, "w", encoding="utf-8") as kubeconfig:
-            kubeconfig.write(file_content)
+        response = client.get_k8s_cluster_kubeconfig(cluster_id, stream=True)
+        with open(save, "wb") as kubeconfig:
+            for chunk in response.iter_content(chunk_size=65536):
+                kubeconfig.write(chunk)
     else:
+        file_content = client.get_k8s_cluster_kubeconfig(cluster_id).text
         fmt.print_colored(file_content, lang="yaml")
 
 
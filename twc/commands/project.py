@@ -27,12 +27,13 @@ project.add_typer(project_resource, name="resource", aliases=["rsrc"])
 
 # API issue: Inconsistent resource naming
 # Some entities have different names in cases.
-RESOURCE_TYPES = [
-    *[r.value for r in ResourceType],
-    "cluster",  # also named 'kubernetes'
-    "bucket",  # also named 'storage'
-    "dedicated_server",  # also named 'dedicated'
-]
+RESOURCE_TYPE_ALIASES = {
+    **{r.value: r for r in ResourceType},
+    "cluster": ResourceType.CLUSTER,  # also named 'kubernetes'
+    "bucket": ResourceType.BUCKET,  # also named 'storage'
+    "dedicated_server": ResourceType.DEDICATED_SERVER,  # also 'dedicated'
+}
+RESOURCE_TYPES = list(RESOURCE_TYPE_ALIASES)
 
 
 # ------------------------------------------------------------- #
@@ -214,18 +215,10 @@ def project_resource_list(
     client = create_client(config, profile)
     if not resource_type:
         response = client.get_project_resources(project_id)
-    elif resource_type in ["bucket", "storage"]:
-        response = client.get_project_buckets(project_id)
-    elif resource_type in ["kubernetes", "cluster"]:
-        response = client.get_project_clusters(project_id)
-    elif resource_type == "balancer":
-        response = client.get_project_balancers(project_id)
-    elif resource_type == "database":
-        response = client.get_project_databases(project_id)
-    elif resource_type in ["dedicated", "dedicated_server"]:
-        response = client.get_project_dedicated_servers(project_id)
-    elif resource_type == "server":
-        response = client.get_project_servers(project_id)
+    elif resource_type in RESOURCE_TYPE_ALIASES:
+        response = client.get_project_resources_by_type(
+            project_id, RESOURCE_TYPE_ALIASES[resource_type]
+        )
     else:
         raise UsageError(
             f"Resource type is not in [{', '.join(RESOURCE_TYPES)}]"
@@ -281,33 +274,32 @@ def project_resource_move(
 ):
     """Move resources between projects."""
     client = create_client(config, profile)
-    if balancer:
-        for balancer_id in balancer:
-            print_result(
-                client.add_balancer_to_project(balancer_id, project_id)
-            )
-    if bucket:
-        for bucket_id in bucket:
-            if not bucket_id.isdigit():
-                bucket_id = resolve_bucket_id(client, bucket_id)
-            response = client.add_bucket_to_project(bucket_id, project_id)
+    bucket = [
+        (
+            bucket_id
+            if bucket_id.isdigit()
+            else resolve_bucket_id(client, bucket_id)
+        )
+        for bucket_id in bucket or []
+    ]
+    resources = [
+        *((ResourceType.BALANCER, i) for i in balancer or []),
+        *((ResourceType.BUCKET, i) for i in bucket),
+        *((ResourceType.CLUSTER, i) for i in cluster or []),
+        *((ResourceType.DATABASE, i) for i in database or []),
+        *((ResourceType.DEDICATED_SERVER, i) for i in dedicated or []),
+        *((ResourceType.SERVER, i) for i in server or []),
+    ]
+    # Moves are sent one by one: the command stops on the first failure
+    # and leaves the rest of resources in place.
+    for resource_type, resource_id in resources:
+        response = client.add_resource_to_project(
+            resource_type, resource_id, project_id
+        )
+        if resource_type == ResourceType.BUCKET:
             if response.status_code == 200:
-                print(bucket_id)
+                print(resource_id)
             else:
                 sys.exit(fmt.printer(response))
-    if cluster:
-        for cluster_id in cluster:
-            print_result(client.add_cluster_to_project(cluster_id, project_id))
-    if database:
-        for database_id in database:
-            print_result(
-                client.add_database_to_project(database_id, project_id)
-            )
-    if dedicated:
-        for dedic_id in dedicated:
-            print_result(
-                client.add_dedicated_server_to_project(dedic_id, project_id)
-            )
-    if server:
-        for server_id in server:
-            print_result(client.add_server_to_project(server_id, project_id))
+        else:
+            print_result(response)
@@ -0,0 +1,34 @@
+"""Root command help text. Generated by 'make helptext', do not edit."""
+
+HELP = """\
+Usage: twc [OPTIONS] COMMAND [ARGS]...
+
+  CLI for Timeweb Cloud services.
+
+Options:
+  --version             Show version and exit.
+  -v, --verbose         Enable verbose mode.
+  -c, --config FILE     Use config.
+  -p, --profile NAME    Use profile.
+  --install-completion  Install completion for the current shell.
+  --show-completion     Show completion for the current shell, to copy it or
+                        customize the installation.
+  -h, --help            Show this message and exit.
+
+Commands:
+  account   Manage Timeweb Cloud account.
+  balancer  Manage load balancers. (aliases: balancers, lb)
+  cluster   Manage Kubernetes clusters. (aliases: clusters, kubernetes, k8s)
+  config    Manage CLI configuration.
+  database  Manage databases. (aliases: databases, db)
+  domain    Manage domains and DNS records. (aliases: domains, d)
+  firewall  Manage Cloud Firewall rules and groups. (aliases: fw)
+  image     Manage disk images. (aliases: images, i)
+  ip        Manage floating IPs. (aliases: ips)
+  project   Manage projects. (aliases: projects, p)
+  server    Manage Cloud Servers. (aliases: servers, s)
+  ssh-key   Manage SSH-keys. (aliases: ssh-keys, k)
+  storage   Manage object storage buckets. (aliases: storages, s3)
+  version   Show version and exit.
+  vpc       Manage virtual networks. (aliases: vpcs, network, networks)
+  whoami    Display current login."""
@@ -1,8 +1,21 @@
 """Typer eXtended."""
 
-from typing import Optional, Union, Any, Type, Dict, Callable, Sequence, List
+import importlib
+from typing import (
+    Optional,
+    Union,
+    Any,
+    Type,
+    Dict,
+    Callable,
+    Sequence,
+    List,
+    Tuple,
+)
 
+import click
 from typer import Typer
+from typer.main import get_group_from_info
 from typer.models import CommandFunctionType, CommandInfo, TyperInfo, Default
 from typer.core import TyperCommand, TyperGroup
 
@@ -147,16 +160,13 @@ class TyperAlias(Typer):
             aliases = []
 
         # Add aliases into group short_help.
-        for group in self.registered_groups:
-            if aliases:
-                if group.name == name:
-                    help_text = (
-                        group.typer_instance.info.short_help
-                        or group.typer_instance.info.help
-                    )
-                    group.typer_instance.info.short_help = (
-                        f"{help_text} (aliases: {', '.join(aliases)})"
-                    )
+        if aliases:
+            help_text = (
+                typer_instance.info.short_help or typer_instance.info.help
+            )
+            typer_instance.info.short_help = (
+                f"{help_text} (aliases: {', '.join(aliases)})"
+            )
 
         # Register aliases for groups.
         for alias in aliases:
@@ -182,3 +192,67 @@ class TyperAlias(Typer):
                     rich_help_panel=rich_help_panel,
                 )
             )
+
+
+class LazyGroup(TyperGroup):
+    """Click group which imports subcommands on first access.
+
+    Subcommands are declared in `lazy_subcommands` as mapping of command
+    name to `(module_path, attr_name)` pair where `attr_name` is `Typer`
+    instance. Module is imported only when subcommand is actually called,
+    so `twc version` does not pay import cost of all commands. Aliases are
+    declared in `lazy_aliases` as mapping of alias to command name.
+    Example::
+
+        class Commands(LazyGroup):
+            lazy_subcommands = {"server": ("twc.commands.server", "server")}
+            lazy_aliases = {"s": "server"}
+
+        cli = TyperAlias(cls=Commands)
+
+    Ref: https://click.palletsprojects.com/en/8.1.x/complex/#lazily-loading-subcommands
+    """
+
+    lazy_subcommands: Dict[str, Tuple[str, str]] = {}
+    lazy_aliases: Dict[str, str] = {}
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._aliases: Dict[str, List[str]] = {}
+        for alias, name in self.lazy_aliases.items():
+            self._aliases.setdefault(name, []).append(alias)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        cmd_name = self.lazy_aliases.get(cmd_name, cmd_name)
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import module and make Click group from `Typer` instance the same
+        way as `TyperAlias.add_typer()` does.
+        """
+        module_path, attr_name = self.lazy_subcommands[cmd_name]
+        typer_instance = getattr(
+            importlib.import_module(module_path), attr_name
+        )
+        group = get_group_from_info(
+            TyperInfo(
+                typer_instance,
+                name=cmd_name,
+                no_args_is_help=Default(True),
+                context_settings=Default(CONTEXT_SETTINGS),
+            ),
+            pretty_exceptions_short=typer_instance.pretty_exceptions_short,
+            rich_markup_mode=self.rich_markup_mode,
+        )
+        aliases = self._aliases.get(cmd_name)
+        if aliases:
+            help_text = group.short_help or group.help
+            group.short_help = f"{help_text} (aliases: {', '.join(aliases)})"
+        return group